@@ -51,26 +51,64 @@ from ._astropy_init import *  # noqa
 
 # GENERAL
 
-from amuse.units import constants, nbody_system
+import importlib
 
 
 # PROJECT-SPECIFIC
 
-from .datamodel import System, Systems
-from .ic import (
-    initialize_system,
-    recreate_system,
-)
-from .units import (
-    # amuse_units as u,
-    amuse_units as amu,
-    astropy_units as apu,
-    to_astropy,
-    to_amuse,
-)
-
-# Import top-level modules for __all__
-from . import data, utils, datamodel, ic, simulation, units
+# the AMUSE-dependent modules are imported lazily, on first access.
+# name: (module, attribute or None for the module itself)
+_LAZY_ATTRIBUTES = {
+    # GENERAL
+    "constants": ("amuse.units.constants", None),
+    "nbody_system": ("amuse.units.nbody_system", None),
+    # PROJECT-SPECIFIC
+    # datamodel
+    "System": (".datamodel", "System"),
+    "Systems": (".datamodel", "Systems"),
+    # ic
+    "initialize_system": (".ic", "initialize_system"),
+    "recreate_system": (".ic", "recreate_system"),
+    # units
+    "amu": (".units", "amuse_units"),
+    "apu": (".units", "astropy_units"),
+    "to_astropy": (".units", "to_astropy"),
+    "to_amuse": (".units", "to_amuse"),
+    # top-level modules
+    "data": (".data", None),
+    "utils": (".utils", None),
+    "datamodel": (".datamodel", None),
+    "ic": (".ic", None),
+    "simulation": (".simulation", None),
+    "units": (".units", None),
+}
+
+
+def __getattr__(name: str):
+    """Import attributes on first access (PEP 562)."""
+    try:
+        module_name, attr = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    module = importlib.import_module(module_name, __name__)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value  # cache, so __getattr__ is not called again
+
+    return value
+
+
+# /def
+
+
+def __dir__():
+    """Module attributes, including those not yet imported."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+# /def
 
 
 ##############################################################################
@@ -7,6 +7,8 @@ Routine Listings
 AttrDict
 proxy_reconstructor
 amuse_socket_reconstructor
+particles_reconstructor
+LazyAmuseSocket
 AmuseContainer
 
 
@@ -19,6 +21,9 @@ __all__ = [
     "AttrDict",
     "proxy_reconstructor",
     "amuse_socket_reconstructor",
+    "particles_reconstructor",
+    "LazyAmuseSocket",
+    "PICKLE_PROTOCOL",
 ]
 
 
@@ -27,16 +32,40 @@ __all__ = [
 
 # GENERAL
 
-import warnings
+import functools
+import logging
+import pickle
 import wrapt
 from inspect import BoundArguments
 
+import numpy as np
+
 # typing
-from typing import Optional, Any
+from typing import Optional, Any, Sequence
 
 # amuse
 from amuse.datamodel.particles import Particles
+from amuse.units.quantities import is_quantity
+
+
+###############################################################################
+# PARAMETERS
 
+PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+"""Default pickle protocol, used by ``__reduce__``."""
+
+_LOG = logging.getLogger(__name__)
+
+# names ``wrapt.ObjectProxy`` reads from the object it wraps
+_PROXY_COPIED = frozenset(
+    {
+        "__name__",
+        "__qualname__",
+        "__module__",
+        "__annotations__",
+        "__annotate__",
+    }
+)
 
 ###############################################################################
 # CODE
@@ -44,17 +73,42 @@ from amuse.datamodel.particles import Particles
 
 
 class AttrDict(dict):
-    """A dictionary with getattr and setattr methods."""
+    """A dictionary with getattr and setattr methods.
+
+    Attribute access falls back to the items, so a key cannot shadow
+    a dict method: ``d.keys`` is always the method, ``d["keys"]`` the item.
+
+    """
+
+    __slots__ = ()
 
     def __getattr__(self, name: str):
         """Redirects to __getitem__."""
-        return super().__getitem__(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
 
     # /def
 
     def __setattr__(self, name: str, value: Any):
         """Redirects to __setitem__."""
-        return super().__setitem__(name, value)
+        self[name] = value
+
+    # /def
+
+    def __delattr__(self, name: str):
+        """Redirects to __delitem__."""
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    # /def
+
+    def __repr__(self) -> str:
+        """String representation, like a dict."""
+        return f"{self.__class__.__name__}({dict.__repr__(self)})"
 
     # /def
 
@@ -62,6 +116,28 @@ class AttrDict(dict):
 # /class
 
 
+class _FrozenAttrDict(AttrDict):
+    """An AttrDict that cannot be modified."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        """Cannot modify."""
+        raise TypeError(f"{self.__class__.__name__} is read-only")
+
+    # /def
+
+    __setitem__ = __setattr__ = __delitem__ = __delattr__ = _read_only
+    update = pop = popitem = clear = setdefault = __ior__ = _read_only
+
+
+# /class
+
+
+# shared by containers without channels, replaced on the first channel
+_EMPTY = _FrozenAttrDict()
+
+
 def proxy_reconstructor(cls, wrapped_reduce: tuple, name: str):
     """Reconstruct a proxy object.
 
@@ -71,7 +147,9 @@ def proxy_reconstructor(cls, wrapped_reduce: tuple, name: str):
         the ObjectProxy class object
     wrapped_reduce: tuple
         the reduced form of the proxied oject.
-        form (reconstructor, (cls, *args), {state})
+        form (reconstructor, (cls, *args), {state}, {listitems},
+        {dictitems}, {state_setter}), as from ``__reduce_ex__``.
+        the optional items may be omitted.
     name: str
         the name of the object
         generally 'particles', 'evolution', or 'gravity'
@@ -82,42 +160,29 @@ def proxy_reconstructor(cls, wrapped_reduce: tuple, name: str):
         the reconstruced proxied object
 
     """
-    # break apart wrapped_reduce
-    if len(wrapped_reduce) == 2:
-        proxied_obj_reconstructor, args = wrapped_reduce
-        state = None
-        app = None
-        kv = None
-        objstate = None
-    else:
-        proxied_obj_reconstructor, args, *rest = wrapped_reduce
-
-        state = None
-        app = None
-        kv = None
-        objstate = None
-
-        if len(rest) > 0:
-            state = rest[0]
-        if len(rest) > 1:
-            app = rest[1]
-        if len(rest) > 2:
-            kv = rest[2]
-        if len(rest) > 3:
-            objstate = rest[3]  # TODO
-
-        objstate  # TODO, USE
+    # break apart wrapped_reduce, padding the optional items with None
+    (
+        proxied_obj_reconstructor,
+        args,
+        state,
+        app,
+        kv,
+        state_setter,
+    ) = tuple(wrapped_reduce) + (None,) * (6 - len(wrapped_reduce))
 
     # make wrapped object
     wrapped = proxied_obj_reconstructor(*args)
 
     if state is not None:
-        try:
-            wrapped.__setstate__
-        except AttributeError:
-            wrapped.__dict__.update(state)
+        if state_setter is not None:
+            state_setter(wrapped, state)
         else:
-            wrapped.__setstate__(state)
+            try:
+                wrapped.__setstate__
+            except AttributeError:
+                wrapped.__dict__.update(state)
+            else:
+                wrapped.__setstate__(state)
 
     if app is not None:
         for item in app:
@@ -169,6 +234,400 @@ def amuse_socket_reconstructor(
 # /def
 
 
+def particles_reconstructor(
+    keys: np.ndarray,
+    attributes: Sequence[str],
+    units: Sequence[Any],
+    values: Sequence[np.ndarray],
+):
+    """Reconstruct a Particles set from its raw attribute arrays.
+
+    Parameters
+    ----------
+    keys: ndarray
+        the particle keys
+    attributes: list of str
+        the attribute names
+    units: list
+        the amuse unit of each attribute, None if unitless
+    values: list of ndarray
+        the raw value arrays of each attribute
+
+    Returns
+    -------
+    particles: Particles
+
+    """
+    particles = Particles(keys=keys)
+
+    for name, unit, value in zip(attributes, units, values):
+        if unit is not None:
+            value = unit.new_quantity(value)  # no copy
+        setattr(particles, name, value)
+
+    return particles
+
+
+# /def
+
+
+class _ParticlesPayload:
+    """Pickle a Particles set as raw attribute arrays.
+
+    NumPy arrays pickle as out-of-band ``PickleBuffer`` frames with
+    protocol 5, so the attribute data is not copied by the pickler.
+    Unpickles as a Particles set via `particles_reconstructor`.
+
+    """
+
+    __slots__ = ("particles",)
+
+    def __init__(self, particles: Particles):
+        self.particles = particles
+
+    # /def
+
+    def __reduce_ex__(self, protocol: int):
+        """Reduce to `particles_reconstructor`."""
+        particles = self.particles
+        attributes = particles.get_attribute_names_defined_in_store()
+
+        units, values = [], []
+        for name in attributes:
+            value = getattr(particles, name)
+            if is_quantity(value):
+                units.append(value.unit)
+                values.append(value.number)
+            else:
+                units.append(None)
+                values.append(np.asarray(value))
+
+        return (
+            particles_reconstructor,
+            (particles.key, attributes, units, values),
+        )
+
+    # /def
+
+
+# /class
+
+
+def _particles_for_pickle(particles: Particles, protocol: int):
+    """Particles in a picklable form.
+
+    Parameters
+    ----------
+    particles: Particles
+    protocol: int
+        pickle protocol. for protocol 5+ the particles are pickled as
+        raw arrays with out-of-band buffers, otherwise they are copied.
+
+    """
+    if protocol >= 5:  # raw arrays, pickled out-of-band
+        return _ParticlesPayload(particles)
+    return particles.copy()
+
+
+# /def
+
+
+class _LazyProxy(wrapt.ObjectProxy):
+    """Proxy that wraps None until first use, then the made object.
+
+    Subclasses make the object in ``_make``. Attribute access, and the
+    dunders that ``wrapt.ObjectProxy`` forwards to the wrapped object,
+    make the object first, so the proxy never acts like None.
+    ``repr`` does not make the object.
+
+    """
+
+    def _make(self):
+        """Make the wrapped object."""
+        raise NotImplementedError
+
+    # /def
+
+    def _materialize(self):
+        """Make the wrapped object, if not already made."""
+        if self.__wrapped__ is None:
+            self.__wrapped__ = self._make()
+
+        return self.__wrapped__
+
+    # /def
+
+    def __getattr__(self, name: str):
+        """Make the object on first access.
+
+        Except for the names ``wrapt.ObjectProxy`` copies when wrapping,
+        so wrapping the proxy does not make the object.
+
+        """
+        if name.startswith("_self_") or (
+            name in _PROXY_COPIED and self.__wrapped__ is None
+        ):
+            raise AttributeError(name)
+        return getattr(self._materialize(), name)
+
+    # /def
+
+    def __setattr__(self, name: str, value: Any):
+        """Make the object before setting on it."""
+        if not name.startswith("_self_") and name != "__wrapped__":
+            self._materialize()
+        super().__setattr__(name, value)
+
+    # /def
+
+    @property
+    def __class__(self):
+        """Class of the made object, for `isinstance`."""
+        return self._materialize().__class__
+
+    # /def
+
+    def __repr__(self) -> str:
+        """Representation, without making the object."""
+        if self.__wrapped__ is None:
+            return f"<{type(self).__name__}, not yet made>"
+        return repr(self.__wrapped__)
+
+    # /def
+
+    # the dunders ObjectProxy forwards, made first
+
+    def __str__(self) -> str:
+        return str(self._materialize())
+
+    def __dir__(self):
+        return dir(self._materialize())
+
+    def __bool__(self) -> bool:
+        return bool(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __contains__(self, value) -> bool:
+        return value in self._materialize()
+
+    def __getitem__(self, key):
+        return self._materialize()[key]
+
+    def __eq__(self, other) -> bool:
+        return self._materialize() == other
+
+    def __ne__(self, other) -> bool:
+        return self._materialize() != other
+
+    def __hash__(self) -> int:
+        return hash(self._materialize())
+
+    def __call__(self, *args, **kwargs):
+        return self._materialize()(*args, **kwargs)
+
+    def __enter__(self):
+        return self._materialize().__enter__()
+
+    def __exit__(self, *args):
+        return self._materialize().__exit__(*args)
+
+
+# /class
+
+
+class LazyAmuseSocket(_LazyProxy):
+    """Lazily reconstructed AMUSE Socket Object.
+
+    Stands in for a socket object (like SSE or BHTree) after unpickling.
+    The object, and its worker process, is only made by
+    `amuse_socket_reconstructor` on first use.
+
+    Parameters
+    ----------
+    cls: type
+        the function or class
+        like SSE() or BHTree()
+    ba: BoundArguments
+        BoundArguments for `cls`
+    particles: Particles
+        the particles. will be assigned to the object.
+
+    """
+
+    def __init__(self, cls, ba: BoundArguments, particles: Particles):
+        """Store the reconstruction arguments."""
+        super().__init__(None)
+        self._self_factory = (cls, ba)
+        self._self_particles = particles
+
+    # /def
+
+    def _make(self):
+        """Make the socket object."""
+        obj = amuse_socket_reconstructor(
+            *self._self_factory, self._self_particles
+        )
+        self._self_particles = None  # now held by the socket object
+        return obj
+
+    # /def
+
+    def __repr__(self) -> str:
+        """Representation, without starting the socket object."""
+        if self.__wrapped__ is None:
+            name = getattr(self._self_factory[0], "__name__", "socket")
+            return f"<{type(self).__name__} of {name}, not yet started>"
+        return repr(self.__wrapped__)
+
+    # /def
+
+    def __reduce_ex__(self, protocol: int):
+        """Reduce method for pickling.
+
+        Does not make the socket object if it has not yet been made.
+
+        """
+        if self.__wrapped__ is None:
+            particles = self._self_particles
+        else:
+            particles = self.particles
+
+        return (
+            LazyAmuseSocket,
+            (*self._self_factory, _particles_for_pickle(particles, protocol)),
+        )
+
+    # /def
+
+    def __reduce__(self):
+        """Reduce method for pickling, with `PICKLE_PROTOCOL`."""
+        return self.__reduce_ex__(PICKLE_PROTOCOL)
+
+    # /def
+
+
+# /class
+
+
+class _LazyChannel(_LazyProxy):
+    """Channel made on first use.
+
+    For channels to a `LazyAmuseSocket` that is not yet started,
+    so making the channel does not start the socket object.
+
+    Parameters
+    ----------
+    factory: Callable
+        signature:: factory() -> channel
+
+    """
+
+    def __init__(self, factory):
+        """Store the channel factory."""
+        super().__init__(None)
+        self._self_factory = factory
+
+    # /def
+
+    def _make(self):
+        """Make the channel."""
+        return self._self_factory()
+
+    # /def
+
+
+# /class
+
+
+def _unmade(obj: Any) -> bool:
+    """Whether `obj`, or the object in an AmuseContainer, is not yet made.
+
+    Only checks types, so does not make the object.
+
+    """
+    if issubclass(type(obj), AmuseContainer):
+        obj = obj.__wrapped__
+    return issubclass(type(obj), _LazyProxy) and obj.__wrapped__ is None
+
+
+# /def
+
+
+def _name_of(obj: Any) -> str:
+    """Channel name of `obj`: ``obj.name``.
+
+    The container name is used for AmuseContainers of objects not yet
+    made, so the object is not made.
+
+    Raises
+    ------
+    ValueError
+        if `obj` does not have a name
+
+    """
+    if _unmade(obj) and issubclass(type(obj), AmuseContainer):
+        return obj._self_name
+    elif hasattr(obj, "name"):
+        return obj.name
+    raise ValueError("need to pass name")
+
+
+# /def
+
+
+def _has_particles(obj: Any) -> bool:
+    """Whether `obj` has ``.particles``.
+
+    A `LazyAmuseSocket` always has particles, and is not probed,
+    so the socket object is not made.
+
+    """
+    if type(obj) is LazyAmuseSocket:
+        return True
+    return hasattr(obj, "particles")
+
+
+# /def
+
+
+def _resolve(obj: Any):
+    """The channel end-point of `obj`: ``obj.particles`` if it exists."""
+    has_particles = getattr(obj, "_self_has_particles", None)
+    if has_particles is None:  # not an AmuseContainer
+        has_particles = _has_particles(obj)
+
+    return obj.particles if has_particles else obj
+
+
+# /def
+
+
+def _new_channel(going_from: Any, going_to: Any, attributes):
+    """Channel between `going_from` and `going_to`, or a lazy one.
+
+    If either end is not yet made, the channel is a `_LazyChannel`,
+    made, with the end-points, on first use.
+
+    """
+
+    def make():
+        return _resolve(going_from).new_channel_to(
+            _resolve(going_to), attributes=attributes
+        )
+
+    if _unmade(going_from) or _unmade(going_to):
+        return _LazyChannel(make)
+    return make()
+
+
+# /def
+
+
 ##########################################################################
 
 
@@ -196,6 +655,19 @@ class AmuseContainer(wrapt.ObjectProxy):
 
     """
 
+    __slots__ = (
+        "_self_name",
+        "_self_channel_to",
+        "_self_channel_from",
+        "_self__inputs",
+        "_self_has_particles",
+    )
+
+    # container attributes, stored as ``_self_<name>``
+    _SELF_NAMES = frozenset(
+        {"name", "channel_to", "channel_from", "_inputs", "has_particles"}
+    )
+
     def __init__(
         self, wrapped: Any, name: str, _inputs: Optional[BoundArguments] = None
     ):
@@ -204,27 +676,32 @@ class AmuseContainer(wrapt.ObjectProxy):
         super().__init__(wrapped)
         # add name
         self._self_name = name
-        # add channel hooks
-        self._self_channel_to = AttrDict()
-        self._self_channel_from = AttrDict()
+        # add channel hooks (copy-on-write)
+        self._self_channel_to = _EMPTY
+        self._self_channel_from = _EMPTY
         # add wrapped object's bound-argument inputs
         self._self__inputs = _inputs
+        # cache whether wrapped has particles, for channels
+        self._self_has_particles = _has_particles(wrapped)
 
     # /def
 
     def __getattr__(self, name: str):
         """Redefine __getattr__ so that also checks container."""
+        # dunders (e.g. NumPy's __array_ufunc__ probes) are never in the
+        # container, so only check original object
+        if name[:2] == "__" == name[-2:] and name != "__wrapped__":
+            return getattr(self.__wrapped__, name)
+
         # first check original object
         try:
             return super().__getattr__(name)
         # now try getting from container
         except AttributeError:
-            try:  # try container
+            if name in self._SELF_NAMES:  # try container
                 return object.__getattribute__(self, "_self_" + name)
-            except AttributeError:  # not in container either
-                raise AttributeError(
-                    "neither container nor object has attribute"
-                )
+            # not in container either
+            raise AttributeError("neither container nor object has attribute")
 
     # /def
 
@@ -235,17 +712,17 @@ class AmuseContainer(wrapt.ObjectProxy):
         """Getitem via getattr.
 
         supports key.subkey where `key` is in self and `subkey`
-        is an attribute of `self.key`
+        is an attribute of `self.key`, to any depth (key.subkey.subsubkey).
+        Non-string keys, e.g. index arrays, index the wrapped object.
 
         """
-        try:
-            ks = key.split(".")
-            if len(ks) == 1:  # only one key
-                return getattr(self, ks[0])
-            else:  # pass to AmuseContainer
-                return getattr(getattr(self, ks[0]), ks[1])
-        except AttributeError:  # it's not a string
+        if not isinstance(key, str):
+            return self.__wrapped__[key]
+
+        if "." not in key:  # only one key
             return getattr(self, key)
+        # follow each attribute in turn
+        return functools.reduce(getattr, key.split("."), self)
 
     # /def
 
@@ -263,6 +740,9 @@ class AmuseContainer(wrapt.ObjectProxy):
         ----------
         protocol
             passed to wrapped object's ``__reduce_ex__``
+            for protocol 5+ socket-object particles are pickled
+            as raw arrays with out-of-band buffers.
+            protocol 2+ is required.
 
         Returns
         -------
@@ -274,17 +754,23 @@ class AmuseContainer(wrapt.ObjectProxy):
         -----
         first tries the internal serialization technique (__reduce_ex__)
         if that fails, which it will for socket objects like BHTree,
-        fall back to my socket reconstructor function
+        fall back to my socket reconstructor function.
+        Socket objects unpickle as a `LazyAmuseSocket`, which only
+        starts the socket object on first use.
         this requires that the AmuseContainer has the input information
         to the wrapped object as the serialization works by making the object
         then adding the particles.
         The particles need to be copied. This can be memory intensive but also
         means that any links MUST BE RE-ESTABLISHED.
+        With protocol 5+ the particle attribute arrays are handed to the
+        pickler directly, avoiding the intermediate copy.
 
         See Also
         --------
         proxy_reconstructor
         amuse_socket_reconstructor
+        particles_reconstructor
+        LazyAmuseSocket
 
         TODO
         ----
@@ -292,16 +778,17 @@ class AmuseContainer(wrapt.ObjectProxy):
 
         """
         # Serialize the wrapped object
-        if self._inputs is None:
+        # (a LazyAmuseSocket reduces itself, without starting)
+        if self._self__inputs is None:
             internal_redx = self.__wrapped__.__reduce_ex__(protocol)
 
         else:
             internal_redx = (
-                amuse_socket_reconstructor,  # reconstructor
+                LazyAmuseSocket,  # reconstructor
                 (
                     self.__class__,
-                    self._inputs,
-                    self.particles.copy(),
+                    self._self__inputs,
+                    _particles_for_pickle(self.particles, protocol),
                 ),  # (cls, *args)
                 None,  # state
             )
@@ -321,6 +808,12 @@ class AmuseContainer(wrapt.ObjectProxy):
 
     # /def
 
+    def __reduce__(self):
+        """Reduce method for pickling, with `PICKLE_PROTOCOL`."""
+        return self.__reduce_ex__(PICKLE_PROTOCOL)
+
+    # /def
+
     # ---------------------------------------------------------------
     # channels
 
@@ -353,42 +846,27 @@ class AmuseContainer(wrapt.ObjectProxy):
         ValueError
             if `going_to` is not an AmuseContainer and `name` is None
             or if self.name == `name`
-        warning
+        logs a warning
             if `name` (or `going_to.name`) is already in ``.channel_to``
 
         """
         # 1st check if thing is my object
         if name is None:
-            if hasattr(going_to, "name"):  # System has name
-                name = going_to.name
-            else:
-                raise ValueError("need to pass name")
+            name = _name_of(going_to)  # System has name
 
         # next check that NOT making channel to same thing
-        if self.name == name:
+        if _name_of(self) == name:
             raise ValueError("cannot make channel to self")
-        elif name in self.channel_to.keys():
-            warnings.warn(f"{name} already exists in channels. overwriting.")
+        elif name in self._self_channel_to:
+            _LOG.warning("%s already exists in channels. overwriting.", name)
 
-        # making channel
-        if hasattr(self, "particles") and hasattr(going_to, "particles"):
-            self.channel_to[name] = self.particles.new_channel_to(
-                going_to.particles, attributes=attributes
-            )
-        elif hasattr(self, "particles"):  # (so going_to does not)
-            self.channel_to[name] = self.particles.new_channel_to(
-                going_to, attributes=attributes
-            )
-        elif hasattr(going_to, "particles"):  # (so self does not)
-            self.channel_to[name] = self.new_channel_to(
-                going_to.particles, attributes=attributes
-            )
-        else:  # (neither self nor going_to has .particles)
-            self.channel_to[name] = self.new_channel_to(
-                going_to, attributes=attributes
-            )
+        # making channel, between .particles where they exist
+        if self._self_channel_to is _EMPTY:
+            self._self_channel_to = AttrDict()
+        channel = _new_channel(self, going_to, attributes)
+        self._self_channel_to[name] = channel
 
-        return self.channel_to[name]
+        return channel
 
     # /def
 
@@ -421,42 +899,27 @@ class AmuseContainer(wrapt.ObjectProxy):
         ValueError
             if `going_from` is not an AmuseContainer and `name` is None
             or if self.name == `name`
-        warning
+        logs a warning
             if `name` (or `going_from.name`) is already in ``.channel_from``
 
         """
         # 1st check if thing is my object
         if name is None:
-            if hasattr(going_from, "name"):
-                name = going_from.name
-            else:
-                raise ValueError("need to pass name")
+            name = _name_of(going_from)
 
         # next check that not making channel to same thing
-        if self.name == name:
+        if _name_of(self) == name:
             raise ValueError("cannot make channel to self")
-        elif name in self.channel_from.keys():
-            warnings.warn(f"{name} already exists in channels. overwriting.")
+        elif name in self._self_channel_from:
+            _LOG.warning("%s already exists in channels. overwriting.", name)
 
-        # making channels
-        if hasattr(self, "particles") and hasattr(going_from, "particles"):
-            self.channel_from[name] = going_from.particles.new_channel_to(
-                self.particles, attributes=attributes
-            )
-        elif hasattr(self, "particles"):  # (so going_from does not)
-            self.channel_from[name] = going_from.new_channel_to(
-                self.particles, attributes=attributes
-            )
-        elif hasattr(going_from, "particles"):  # (so self does not)
-            self.channel_from[name] = going_from.particles.new_channel_to(
-                self, attributes=attributes
-            )
-        else:  # (neither self nor going_from has .particles)
-            self.channel_from[name] = going_from.new_channel_to(
-                self, attributes=attributes
-            )
+        # making channels, between .particles where they exist
+        if self._self_channel_from is _EMPTY:
+            self._self_channel_from = AttrDict()
+        channel = _new_channel(going_from, self, attributes)
+        self._self_channel_from[name] = channel
 
-        return self.channel_from[name]
+        return channel
 
     # /def
 
@@ -36,6 +36,15 @@ from amuse.units.quantities import ScalarQuantity
 from ._container import AmuseContainer
 
 
+###############################################################################
+# PARAMETERS
+
+_NAMES = ("particles", "evolution", "gravity")
+_CHANNEL_PAIRS = tuple(itertools.permutations(_NAMES, 2))
+
+_VERBOSE = False  # print channel creation. dropped under ``python -O``
+
+
 ###############################################################################
 # CODE
 ###############################################################################
@@ -80,6 +89,15 @@ class System:
 
     """
 
+    # the attributes needed to rebuild a System
+    _PICKLE_KEYS = (
+        "particles",
+        "evolution",
+        "gravity",
+        "converter",
+        "channel_attrs",
+    )
+
     def __init__(
         self,
         particles: Optional[Particles] = None,
@@ -107,25 +125,24 @@ class System:
 
         for k, v in kw.items():
             setattr(self, k, v)
-
-        names = ["particles", "evolution", "gravity"]
-
-        for n in names:
-            if (self[n] is not None) and not isinstance(
-                self[n], AmuseContainer
-            ):
-                self[n] = AmuseContainer(self[n], n)
-
-        for n1, n2 in itertools.permutations(names, 2):
-            # print("Making channels:")
-            if (self[n1] is not None) and (self[n2] is not None):
-                # print("\t", n1, "<->", n2)
-                self[n1].add_channel_to(
-                    self[n2], attributes=self.channel_attrs
-                )
-                self[n1].add_channel_from(
-                    self[n2], attributes=self.channel_attrs
-                )
+        self._user_keys = tuple(kw)
+
+        # wrap in AmuseContainer
+        containers = {}
+        for n in _NAMES:
+            obj = getattr(self, n)
+            if (obj is not None) and not isinstance(obj, AmuseContainer):
+                obj = AmuseContainer(obj, n)
+                setattr(self, n, obj)
+            containers[n] = obj
+
+        for n1, n2 in _CHANNEL_PAIRS:
+            c1, c2 = containers[n1], containers[n2]
+            if (c1 is not None) and (c2 is not None):
+                if __debug__ and _VERBOSE:
+                    print("Making channels:", n1, "<->", n2)
+                c1.add_channel_to(c2, attributes=channel_attrs)
+                c1.add_channel_from(c2, attributes=channel_attrs)
 
     # /def
 
@@ -139,11 +156,18 @@ class System:
         is an item (dictionary get) of `self.key`
 
         """
-        k0, *ks = key.split(".")
-        if not ks:  # ks is empty
-            return getattr(self, k0)
-        else:  # pass to AmuseContainer
-            return getattr(self, k0)[".".join(ks)]
+        if "." not in key:  # flat key
+            return getattr(self, key)
+        # pass to AmuseContainer
+        k0, rest = key.split(".", 1)
+        return getattr(self, k0)[rest]
+
+    # /def
+
+    def __setattr__(self, name, value):
+        """Setattr, clearing the cached representation."""
+        object.__setattr__(self, "_repr_cache", None)
+        object.__setattr__(self, name, value)
 
     # /def
 
@@ -166,34 +190,34 @@ class System:
             with particles, evolution, and gravity fields.
 
         """
-        _repr = "\n".join(
-            (
-                super().__repr__(),
-                f"\tparticles: {self.particles.__repr__()}",
-                f"\tevolution: {self.evolution.__repr__()}",
-                f"\tgravity: {self.gravity.__repr__()}",
+        if self._repr_cache is None:
+            self._repr_cache = "\n".join(
+                (
+                    super().__repr__(),
+                    f"\tparticles: {self.particles.__repr__()}",
+                    f"\tevolution: {self.evolution.__repr__()}",
+                    f"\tgravity: {self.gravity.__repr__()}",
+                )
             )
-        )
-        return _repr
+        return self._repr_cache
 
     # /def
 
     # ---------------------------------------------------------------
     # Serialize
 
-    def __reduce_ex__(self, protocol):
+    def __reduce__(self):
         """Reduce for serialization.
 
-        TODO FIX
+        Only the codes, the converter, the channel attributes, and the
+        user-added attributes are pickled. The AmuseContainers pickle
+        without their channels, which are remade on reconstruction.
+
         """
-        redx = (
-            _system_reconstructor,
-            ([], self.__dict__,),
-            None,
-            None,
-            None,
-        )
-        return redx
+        kwargs = {
+            k: getattr(self, k) for k in self._PICKLE_KEYS + self._user_keys
+        }
+        return (_system_reconstructor, ([], kwargs))
 
     # /def
 
@@ -222,8 +246,8 @@ class Systems:
         `bridges` arguments into ``self.bridge_internal_systems``
     timestep:
         Bridge timestep
-    use_threading: bool (default False)
-        whether to use threading
+    use_threading: bool (default True)
+        whether to use threading, once more than one system is bridged
     **systems: {name: System} pairs
 
     Returns
@@ -252,24 +276,48 @@ class Systems:
         self._init_internal_bridges = internal_bridges
         self._init_timestep = timestep
 
-        self.gravity = bridge.Bridge(use_threading=use_threading)
-        self.system_list = set()  # system list set
+        self._gravity = None  # Bridge, made on first use
+        self._systems = {}  # insertion-ordered set of system names
+        self._resolved_bridges = None  # cache of resolved internal bridges
 
         for k, v in systems.items():
             self[k] = v
 
         # now do bridges. needed to create systems first
-        self.bridge_internal_systems(
-            bridges=internal_bridges, timestep=timestep
-        )
+        if internal_bridges or timestep is not None:
+            self.bridge_internal_systems(
+                bridges=internal_bridges, timestep=timestep
+            )
 
     # /def
 
+    @property
+    def gravity(self):
+        """The Bridge between the systems.
+
+        Made on first access, without threading, since nothing is bridged
+        yet. ``bridge_internal_systems`` turns threading on once more than
+        one system is bridged.
+
+        """
+        if self._gravity is None:
+            self._gravity = bridge.Bridge(use_threading=False)
+        return self._gravity
+
+    @gravity.setter
+    def gravity(self, value):
+        self._gravity = value
+
     @property
     def time(self):
         """Get the Bridge time"""
         return self.gravity.model_time
 
+    @property
+    def system_list(self):
+        """Names of the systems, in insertion order."""
+        return tuple(self._systems)
+
     # ---------------------------------------------------------------
     # Representations
 
@@ -284,14 +332,15 @@ class Systems:
             TODO full field detail
 
         """
-        _repr = "\n".join(
-            (
-                super().__repr__(),
-                f"\t{self.gravity}",
-                *[f"\t{k}" for k in self.system_list],
+        if self._repr_cache is None:
+            self._repr_cache = "\n".join(
+                (
+                    super().__repr__(),
+                    f"\t{self._gravity or 'Bridge not yet made'}",
+                    *[f"\t{k}" for k in self._systems],
+                )
             )
-        )
-        return _repr
+        return self._repr_cache
 
     # /def
 
@@ -305,18 +354,26 @@ class Systems:
         is an item (dictionary get) of `self.key`
 
         """
-        k0, *ks = key.split(".")
-        if not ks:  # ks is empty
-            return getattr(self, k0)
-        else:  # pass to System
-            return getattr(self, k0)[".".join(ks)]
+        if "." not in key:  # flat key
+            return getattr(self, key)
+        # pass to System
+        k0, rest = key.split(".", 1)
+        return getattr(self, k0)[rest]
+
+    # /def
+
+    def __setattr__(self, name, value):
+        """Setattr, clearing the cached representation."""
+        object.__setattr__(self, "_repr_cache", None)
+        object.__setattr__(self, name, value)
 
     # /def
 
     def __setitem__(self, key, value):
         """Setitem via setattr."""
         setattr(self, key, value)
-        self.system_list.add(key)
+        self._systems[key] = None
+        self._resolved_bridges = None  # names may now resolve differently
 
     # /def
 
@@ -344,22 +401,66 @@ class Systems:
             for chaining
 
         """
-        # add bridges
-        # iterate through dictionary of bridges {'system': []}
-        for name, deps in bridges.items():
-            if not isinstance(deps, (list, tuple)):
-                raise TypeError(f"args for {name} must be a list/tuple")
-            self.gravity.add_system(
-                self[name], partners=[self[dep] for dep in deps]
+        # resolve bridges, reusing the cache for the internal bridges
+        if bridges is self._init_internal_bridges:
+            if self._resolved_bridges is None:
+                self._resolved_bridges = self._resolve_bridges(bridges)
+            resolved = self._resolved_bridges
+        else:
+            resolved = self._resolve_bridges(bridges)
+
+        if self._gravity is None:  # make the Bridge, deciding threading
+            self._gravity = bridge.Bridge(
+                use_threading=self._use_threading and len(resolved) > 1
             )
+        gravity = self._gravity
+
+        # add bridges
+        for target, partners in resolved:
+            gravity.add_system(target, partners=partners)
+
+        # bridges added since the Bridge was made can turn on threading
+        if self._use_threading and len(gravity.codes) > 1:
+            gravity.use_threading = True
 
         if timestep is not None:
             if isinstance(timestep, str):
                 timestep = self[timestep]
-            self.gravity.timestep = timestep  # set gravity
+            gravity.timestep = timestep  # set gravity
             self._init_timestep = timestep  # also (re)save timestep
 
-        return self.gravity
+        return gravity
+
+    # /def
+
+    def _resolve_bridges(self, bridges: dict):
+        """Resolve the names in `bridges` to the systems.
+
+        Parameters
+        ----------
+        bridges: dict
+            ex: "cluster.gravity": ["galaxy.gravity", "cdf_code"]
+
+        Returns
+        -------
+        resolved: tuple
+            of (target, (partner, ...)) pairs
+
+        Raises
+        ------
+        TypeError
+            if the dependencies of a bridge are not a list or tuple
+
+        """
+        resolve = self.__getitem__
+        resolved = []
+        # iterate through dictionary of bridges {'system': []}
+        for name, deps in bridges.items():
+            if not isinstance(deps, (list, tuple)):
+                raise TypeError(f"args for {name} must be a list/tuple")
+            resolved.append((resolve(name), tuple(resolve(d) for d in deps)))
+
+        return tuple(resolved)
 
     # /def
 
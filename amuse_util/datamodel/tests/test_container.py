@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for :mod:`~amuse_util.datamodel._container`."""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+# IMPORTS
+
+# GENERAL
+
+import copy
+import inspect
+import pickle
+
+import numpy as np
+import pytest
+
+from amuse.datamodel import Particles
+from amuse.units import units as u
+
+
+# PROJECT-SPECIFIC
+
+from .._container import AmuseContainer, AttrDict, _EMPTY, _unmade
+from .._system import System
+
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+class SocketCode:
+    """Stands in for a socket code, like BHTree."""
+
+    started = 0  # number of instances made
+
+    def __init__(self, number_of_particles=0):
+        SocketCode.started += 1
+        self.particles = Particles(number_of_particles)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+# /class
+
+
+def make_particles():
+    """Three particles along x."""
+    particles = Particles(3)
+    particles.x = [1.0, 2.0, 3.0] | u.pc
+    return particles
+
+
+# /def
+
+
+def make_socket_container(particles=None):
+    """AmuseContainer of a `SocketCode` with `particles`, and its inputs."""
+    ba = inspect.signature(SocketCode).bind()
+    container = AmuseContainer(SocketCode(), "gravity", _inputs=ba)
+    container.particles.add_particles(
+        make_particles() if particles is None else particles
+    )
+    return container
+
+
+# /def
+
+
+# --------------------------------------------------------------------------
+
+
+def test_attrdict_is_dict():
+    """AttrDict keeps the dict API, with attribute access to items."""
+    d = AttrDict(gravity=1)
+    d.evolution = 2
+
+    assert isinstance(d, dict)
+    assert d == {"gravity": 1, "evolution": 2}
+    assert d.gravity == d["gravity"] == 1
+
+    d.update(particles=3)
+    assert d.pop("particles") == 3
+    assert copy.copy(d) == d
+    assert pickle.loads(pickle.dumps(d)) == d
+
+    with pytest.raises(KeyError):
+        d["missing"]
+    with pytest.raises(AttributeError):
+        d.missing
+    assert not hasattr(d, "missing")
+
+
+# /def
+
+
+def test_attrdict_keys_do_not_shadow_methods():
+    """Items named like dict methods are items, not methods."""
+    d = AttrDict()
+    d["keys"] = d["get"] = "channel"
+    d.items = "channel"
+
+    assert list(d.keys()) == ["keys", "get", "items"]
+    assert d.get("keys") == "channel"
+    assert d["items"] == "channel"
+
+
+# /def
+
+
+def test_frozen_attrdict():
+    """The shared empty channel dict cannot be modified."""
+    for modify in (
+        lambda: _EMPTY.__setitem__("a", 1),
+        lambda: setattr(_EMPTY, "a", 1),
+        lambda: _EMPTY.update(a=1),
+        lambda: _EMPTY.setdefault("a", 1),
+    ):
+        with pytest.raises(TypeError):
+            modify()
+    assert _EMPTY == {}
+
+
+# /def
+
+
+def test_container_getitem():
+    """Items are attributes, to any depth, or index the wrapped set."""
+    particles = Particles(3)
+    particles.x = [1.0, 2.0, 3.0] | u.pc
+    container = AmuseContainer(particles, "particles")
+
+    assert container["name"] == "particles"
+    assert container["x.unit"] is u.pc
+    assert container["x.unit.base"] == u.pc.base
+
+    subset = container[np.array([True, False, True])]
+    assert list(subset.x.value_in(u.pc)) == [1.0, 3.0]
+
+
+# /def
+
+
+@pytest.mark.parametrize("protocol", [2, pickle.HIGHEST_PROTOCOL])
+def test_pickle_sees_attribute_changes(protocol):
+    """Each pickle holds the current particles, not an earlier copy."""
+    container = make_socket_container()
+    pickle.dumps(container, protocol=protocol)
+
+    container.particles.x = [4.0, 5.0, 6.0] | u.pc  # no version change
+    loaded = pickle.loads(pickle.dumps(container, protocol=protocol))
+
+    assert list(loaded.particles.x.value_in(u.pc)) == [4.0, 5.0, 6.0]
+
+
+# /def
+
+
+def test_lazy_socket_acts_like_socket():
+    """An unpickled socket container is made on first use, not as None."""
+    loaded = pickle.loads(pickle.dumps(make_socket_container()))
+    started = SocketCode.started
+
+    assert _unmade(loaded)
+    assert "not yet started" in repr(loaded.__wrapped__)
+    assert SocketCode.started == started  # repr does not start it
+
+    assert isinstance(loaded, SocketCode)
+    assert bool(loaded)
+    with loaded as code:
+        assert list(code.particles.x.value_in(u.pc)) == [1.0, 2.0, 3.0]
+    assert not _unmade(loaded)
+    assert SocketCode.started == started + 1
+
+
+# /def
+
+
+def test_unpickled_system_stays_lazy():
+    """Rebuilding a System's channels does not start its socket codes."""
+    particles = make_particles()
+    system = System(
+        particles=particles, gravity=make_socket_container(particles)
+    )
+    started = SocketCode.started
+
+    loaded = pickle.loads(pickle.dumps(system))
+    repr(loaded)
+    assert _unmade(loaded.gravity)
+    assert SocketCode.started == started
+
+    # the channel starts the code, then copies
+    loaded.particles.x = [7.0, 8.0, 9.0] | u.pc
+    loaded.particles.channel_to.gravity.copy()
+    assert SocketCode.started == started + 1
+    assert list(loaded.gravity.particles.x.value_in(u.pc)) == [7.0, 8.0, 9.0]
+
+
+# /def
+
+
+##############################################################################
+# END
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for :mod:`~amuse_util.datamodel._system`."""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+# IMPORTS
+
+# GENERAL
+
+from amuse.datamodel import Particles
+from amuse.units import units as u
+
+
+# PROJECT-SPECIFIC
+
+from .._system import Systems
+
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+class GravityCode:
+    """Stands in for a gravity code."""
+
+    def __init__(self):
+        self.particles = Particles(1)
+        self.model_time = 0 | u.Myr
+
+
+# /class
+
+
+# --------------------------------------------------------------------------
+
+
+def test_repr_does_not_make_bridge():
+    """Representing a Systems does not make its Bridge."""
+    systems = Systems(a=GravityCode(), b=GravityCode())
+
+    assert "Bridge not yet made" in repr(systems)
+    assert systems._gravity is None
+
+    systems.gravity  # now made
+    assert "Bridge not yet made" not in repr(systems)
+
+
+# /def
+
+
+def test_threading_with_internal_bridges():
+    """Threading is on only once more than one system is bridged."""
+    systems = Systems(
+        a=GravityCode(), b=GravityCode(), internal_bridges={"a": ["b"]}
+    )
+    assert not systems.gravity.use_threading
+
+    gravity = systems.bridge_internal_systems({"b": ["a"]})
+    assert gravity is systems.gravity
+    assert gravity.use_threading
+
+    systems = Systems(
+        a=GravityCode(),
+        b=GravityCode(),
+        internal_bridges={"a": ["b"], "b": ["a"]},
+        use_threading=False,
+    )
+    assert not systems.gravity.use_threading
+
+
+# /def
+
+
+##############################################################################
+# END
@@ -11,6 +11,7 @@ from ._initialize_system import initialize_system, recreate_system
 from .brokenimf import new_kroupa_mass_distribution
 
 from .utils import (
+    build_imf_mass_table,
     num_particles_from_mtot_given_mass_func,
     imf_number_of_particles_decorator,
 )
@@ -28,9 +28,10 @@ __all__ = ["initialize_system", "recreate_system"]
 
 # GENERAAL
 
-import copy
+import functools
 import inspect
 import numpy as np
+from collections import OrderedDict
 
 from typing import Callable
 
@@ -54,6 +55,7 @@ except ImportError:
 from ..datamodel import AmuseContainer, System
 from ..units import to_amuse_decorator
 from ..utils import store_function_input
+from ..utils import _get_store_values, _set_store_values
 
 
 ##############################################################################
@@ -70,6 +72,94 @@ func_or_cls = (Callable, type)
 ##############################################################################
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """Cached `inspect.signature`, for hashable `func`."""
+    return inspect.signature(func)
+
+
+# /def
+
+
+def _signature(func: Callable) -> inspect.Signature:
+    """Signature of `func`.
+
+    The evolution & gravity signatures are fixed, so are cached.
+    Unhashable callables are not cached.
+
+    """
+    try:
+        return _cached_signature(func)
+    except TypeError:  # unhashable
+        return inspect.signature(func)
+
+
+# /def
+
+
+def _light_inputs(ba: inspect.BoundArguments):
+    """Copy of `ba` without the optional keyword `Particles` arguments.
+
+    The inputs are stored to remake socket codes, whose particles are
+    replaced on reconstruction, so holding the particle sets only pins
+    memory. Positional and required arguments are kept, so
+    ``ba.args`` is unchanged and the code can still be remade.
+
+    Parameters
+    ----------
+    ba : `inspect.BoundArguments`
+
+    Returns
+    -------
+    `inspect.BoundArguments`
+
+    """
+    parameters = ba.signature.parameters
+    arguments = OrderedDict()
+    for k, v in ba.arguments.items():
+        param = parameters[k]
+        if param.kind is param.VAR_KEYWORD:
+            v = {n: a for n, a in v.items() if not isinstance(a, Particles)}
+        elif (
+            param.kind is param.KEYWORD_ONLY
+            and param.default is not param.empty
+            and isinstance(v, Particles)
+        ):
+            continue
+        arguments[k] = v
+    return inspect.BoundArguments(ba.signature, arguments)
+
+
+# /def
+
+
+def _shift(objs: Particles, attributes: tuple, offset):
+    """Add `offset` to the `attributes` of `objs`.
+
+    Reads and writes all the attributes in one store call each,
+    and does nothing if the offset is zero.
+
+    Parameters
+    ----------
+    objs : `Particles`
+    attributes : tuple of str
+        ex: ("x", "y", "z")
+    offset : `Quantity`
+        one value per attribute
+
+    """
+    if not np.any(offset.value_in(offset.unit)):  # null offset
+        return
+
+    values = _get_store_values(objs, attributes)
+    _set_store_values(
+        objs, attributes, [v + o for v, o in zip(values, offset)]
+    )
+
+
+# /def
+
+
 @store_function_input(store_inputs=True)
 @to_amuse_decorator(  # ensure inputs are in AMUSE units
     arguments=["Rvirial", "position", "velocity", "obj_radius"]
@@ -79,12 +169,12 @@ def initialize_particles(
     *,  # must use kwargs
     # for IMF
     imf_func: (bool, Callable) = True,
-    imf_args: list = [],
-    imf_kwargs: dict = {},
+    imf_args: (list, tuple, None) = None,
+    imf_kwargs: (dict, None) = None,
     # for distribution function
     distr_func: (bool, Callable) = True,
-    distr_args: list = [],
-    distr_kwargs: dict = {},
+    distr_args: (list, tuple, None) = None,
+    distr_kwargs: (dict, None) = None,
     # object properties
     Rvirial: u.parsec = 10 | u.parsec,
     position: u.kpc = [0, 0, 0] | u.kpc,
@@ -114,10 +204,10 @@ def initialize_particles(
         func(number_of_particles, *imf_args, random=random, **imf_kwargs)
     imf_args: list, optional
         the arguments for `imf_func`
-        (default [])
+        (default None)
     imf_kwargs: dictionary, optional
         the kwargs for `imf_func`
-        (default {})
+        (default None)
 
     distr_func: function
         function for object spatial distribution
@@ -127,10 +217,10 @@ def initialize_particles(
              convert_nbody=converter, **distr_kwargs)
     distr_args: list, optional
         the arguments for `distr_func`
-        (default [])
+        (default None)
     distr_kwargs: dictionary, optional
         the kwargs for `distr_func`
-        (default {})
+        (default None)
 
     Rvirial: distance quantity, optional
         the virial radius of the system
@@ -172,6 +262,14 @@ def initialize_particles(
     if not isinstance(distr_func, Callable):
         raise ValueError("Need to provide a distribution function")
 
+    # -------------------------------------------
+    # defaults
+
+    imf_args = () if imf_args is None else tuple(imf_args)
+    imf_kwargs = {} if imf_kwargs is None else imf_kwargs
+    distr_args = () if distr_args is None else tuple(distr_args)
+    distr_kwargs = {} if distr_kwargs is None else distr_kwargs
+
     # -------------------------------------------
 
     logger.report(
@@ -242,10 +340,11 @@ def initialize_particles(
     )  # make objects from distribution
 
     # scale to standard
-    if _scale_to_standard is not False:
-        kw = {} if _scale_to_standard is True else _scale_to_standard
+    if _scale_to_standard is True:
+        objs.scale_to_standard(convert_nbody=converter)
+    elif _scale_to_standard is not False:
         objs.scale_to_standard(
-            convert_nbody=converter, **kw,
+            convert_nbody=converter, **_scale_to_standard,
         )
 
     logger.report(
@@ -259,8 +358,8 @@ def initialize_particles(
     objs.mass = masses  # masses
 
     # Place system in Galactocentric position
-    objs.position += position
-    objs.velocity += velocity
+    _shift(objs, ("x", "y", "z"), position)
+    _shift(objs, ("vx", "vy", "vz"), velocity)
 
     logger.report("added mean position & velocity to system", verbose=verbose)
 
@@ -289,12 +388,12 @@ def initialize_system(
     *,  # must use kwargs
     # for IMF
     imf_func: (bool, Callable) = True,
-    imf_args: list = [],
-    imf_kwargs: dict = {},
+    imf_args: (list, tuple, None) = None,
+    imf_kwargs: (dict, None) = None,
     # for distribution function
     distr_func: (bool, Callable) = True,
-    distr_args: list = [],
-    distr_kwargs: dict = {},
+    distr_args: (list, tuple, None) = None,
+    distr_kwargs: (dict, None) = None,
     # object properties
     Rvirial: u.parsec = 10 | u.parsec,
     position: u.kpc = [0, 0, 0] | u.kpc,
@@ -302,11 +401,11 @@ def initialize_system(
     obj_radius: u.AU = 0 | u.AU,  # size of each object
     # for evolution
     evln_func: (bool, Callable) = False,
-    evln_kwargs: dict = {},
+    evln_kwargs: (dict, None) = None,
     # for gravity
     gravity_func: (bool, Callable) = False,
-    gravity_args: list = [],
-    gravity_kwargs: dict = {},
+    gravity_args: (list, tuple, None) = None,
+    gravity_kwargs: (dict, None) = None,
     smoothing_length: u.parsec = 0.0 | u.parsec,
     opening_angle: float = 0.6,
     number_of_workers: int = 8,
@@ -450,6 +549,13 @@ def initialize_system(
     else:
         raise ValueError("Need to provide a gravity code")
 
+    # -------------------------------------------
+    # defaults
+
+    evln_kwargs = {} if evln_kwargs is None else evln_kwargs
+    gravity_args = () if gravity_args is None else tuple(gravity_args)
+    gravity_kwargs = {} if gravity_kwargs is None else gravity_kwargs
+
     # -------------------------------------------
 
     logger.report(
@@ -546,11 +652,12 @@ def initialize_system(
 
         # call evolution function
         # only uses key-word arguments
-        _sig = inspect.signature(evln_func)
+        _sig = _signature(evln_func)
         ba = _sig.bind_partial(**evln_kwargs)
 
         _evln = evln_func(*ba.args, **ba.kwargs)
 
+        ba = _light_inputs(ba)
         if _num_particles_reconstruct is not None:
             ba.arguments["number_of_particles"] = _num_particles_reconstruct
         evln = AmuseContainer(_evln, "evolution", _inputs=ba)
@@ -580,7 +687,7 @@ def initialize_system(
     if gravity_func is not False:  # edge cases considered above
 
         # create gravity code
-        _sig = inspect.signature(gravity_func)
+        _sig = _signature(gravity_func)
         ba = _sig.bind_partial(
             converter,
             *gravity_args,
@@ -596,6 +703,7 @@ def initialize_system(
         #     **gravity_kwargs,
         # )
 
+        ba = _light_inputs(ba)
         if _num_particles_reconstruct is not None:
             ba.arguments["number_of_particles"] = _num_particles_reconstruct
         gravity = AmuseContainer(_gravity, "gravity", _inputs=ba)
@@ -664,12 +772,14 @@ def recreate_system(
     # change number_of_particles arg to the `particles` set
     # this will then initialize the system off the existing particles
     # skipping the IMF and distribution function steps
-    ba = copy.copy(ba)
-
-    ba.arguments["number_of_particles"] = particles
+    # fresh arguments, so the input `ba` is not modified
+    arguments = OrderedDict(ba.arguments)
+    arguments["number_of_particles"] = particles
 
     if converter is not None:
-        ba.arguments["converter"] = converter
+        arguments["converter"] = converter
+
+    ba = inspect.BoundArguments(ba.signature, arguments)
 
     # make the system
     system = initialize_system(*ba.args, store_inputs=False, **ba.kwargs)
@@ -21,10 +21,16 @@ __all__ = [
 
 # GENERAL
 
+import copy
+import functools
+
 import numpy as np
 
+# typing
+from typing import Optional, Union
+
 # amuse
-from amuse.ic.brokenimf import new_broken_power_law_mass_distribution
+from amuse.ic.brokenimf import MultiplePartIMF
 from amuse.units import units
 
 
@@ -33,17 +39,140 @@ from amuse.units import units
 from .utils import imf_number_of_particles_decorator
 
 
+##############################################################################
+# PARAMETERS
+
+# Kroupa (2001) mass boundaries [MSun] and power-law exponents
+_KROUPA_MASS_BOUNDARIES = (0.01, 0.08, 0.5, 100.0)
+_KROUPA_ALPHAS = (-0.3, -1.3, -2.3)
+
+
 ##############################################################################
 # CODE
 ##############################################################################
 
 
+@functools.lru_cache(maxsize=32)
+def _truncated_kroupa(mass_min: Optional[float]):
+    """Kroupa mass boundaries and exponents, truncated at `mass_min`.
+
+    Parameters
+    ----------
+    mass_min: float or None
+        the minimum mass, in MSun. None for no truncation.
+
+    Returns
+    -------
+    mass_boundaries: tuple
+        in MSun
+    alphas: tuple
+
+    """
+    mass_boundaries = _KROUPA_MASS_BOUNDARIES
+    alphas = _KROUPA_ALPHAS
+
+    if mass_min is not None:
+        # find where to adj
+        ind = np.searchsorted(mass_boundaries, mass_min, side="right") - 1
+        ind = max(ind, 0)  # mass_min below the lowest boundary
+        mass_boundaries = mass_boundaries[ind:]  # truncate boundaries
+        alphas = alphas[ind:]
+        if mass_boundaries[0] < mass_min:  # adjust value
+            mass_boundaries = (mass_min,) + mass_boundaries[1:]
+
+    return mass_boundaries, alphas
+
+
+# /def
+
+
+@functools.lru_cache(maxsize=32)
+def _broken_power_law_template(
+    mass_boundaries: tuple, alphas: tuple, mass_max: Optional[float]
+):
+    """Cached broken power-law IMF, without a random number generator.
+
+    The IMF precomputes the per-segment fractions and inverse-CDF
+    coefficients, so is reused for calls differing only in the
+    number of particles or the random number generator.
+
+    Parameters
+    ----------
+    mass_boundaries: tuple
+        mass boundaries, in MSun
+    alphas: tuple
+        power-law exponents of each mass range
+    mass_max: float or None
+        the cut-off mass, in MSun
+
+    Returns
+    -------
+    imf: MultiplePartIMF
+        see ``amuse.ic.brokenimf``. Do not modify.
+
+    """
+    return MultiplePartIMF(
+        mass_boundaries=np.array(mass_boundaries) | units.MSun,
+        mass_max=None if mass_max is None else (mass_max | units.MSun),
+        alphas=list(alphas),
+        random=True,
+    )
+
+
+# /def
+
+
+def _broken_power_law_imf(
+    mass_boundaries: tuple,
+    alphas: tuple,
+    mass_max: Optional[float],
+    random: Union[bool, np.random.RandomState],
+):
+    """Broken power-law IMF, drawing with `random`.
+
+    A copy of the cached template, so `random` is not kept alive
+    by the cache.
+
+    Parameters
+    ----------
+    mass_boundaries: tuple
+        mass boundaries, in MSun
+    alphas: tuple
+        power-law exponents of each mass range
+    mass_max: float or None
+        the cut-off mass, in MSun
+    random: bool or RandomState
+        as for ``MultiplePartIMF``. True for ``np.random``,
+        False for evenly distributed masses.
+
+    Returns
+    -------
+    imf: MultiplePartIMF
+        see ``amuse.ic.brokenimf``
+
+    """
+    imf = copy.copy(
+        _broken_power_law_template(mass_boundaries, alphas, mass_max)
+    )
+
+    # attach the generator, as MultiplePartIMF does
+    if not random:
+        imf.random = imf.evenly_distributed
+    elif random is not True:
+        imf.random = random.random_sample
+
+    return imf
+
+
+# /def
+
+
 @imf_number_of_particles_decorator(tolerance=1e-7)
 def new_kroupa_mass_distribution(
     number_of_particles: int,
     mass_min: units.MSun = 0.01 | units.MSun,
     mass_max: units.MSun = 100.0 | units.MSun,
-    random: bool = True,
+    random: Union[bool, np.random.RandomState] = True,
 ):
     """Kroupa (2001) mass distribution in SI units with custom minimum mass.
 
@@ -61,9 +190,10 @@ def new_kroupa_mass_distribution(
         the minimum mass, will modify the default minimum mass range
     mass_max: float quantity
         the cut-off mass (defaults to 100.0 MSun)
-    random: int, random number generator
-        ex: np.random.default_rng(seed=0)
-        will default to random seed
+    random: bool or RandomState
+        ex: np.random.RandomState(seed=0)
+        True (default) draws from ``np.random``.
+        False gives evenly distributed masses.
 
     Returns
     -------
@@ -72,25 +202,17 @@ def new_kroupa_mass_distribution(
         length `number_of_particles`
 
     """
-    mass_boundaries = [0.01, 0.08, 0.5, 100.0] | units.MSun
-    alphas = [-0.3, -1.3, -2.3]
+    mass_boundaries, alphas = _truncated_kroupa(
+        None if mass_min is None else mass_min.value_in(units.MSun)
+    )
 
-    if mass_min is not None:
-        ind = (
-            min(np.where(mass_boundaries > mass_min)[0]) - 1
-        )  # find where to adj
-        mass_boundaries = mass_boundaries[ind:]  # truncate boundaries
-        alphas = alphas[ind:]
-        if mass_boundaries[0] < mass_min:  # adjust value
-            mass_boundaries[0] = mass_min
-
-    kroupa = new_broken_power_law_mass_distribution(
-        number_of_particles,
-        mass_boundaries=mass_boundaries,
-        mass_max=mass_max,
-        alphas=alphas,
-        random=random,
+    imf = _broken_power_law_imf(
+        mass_boundaries,
+        alphas,
+        None if mass_max is None else mass_max.value_in(units.MSun),
+        random,
     )
+    kroupa = imf.next_mass(number_of_particles)
 
     return kroupa
 
@@ -7,6 +7,7 @@ Routine Listings
 MakeSphericalMassEnclModel
 new_sphericalmassencl_model
 new_sphericalmassencl_sphere
+plummer_invcdf
 
 """
 
@@ -16,6 +17,7 @@ __all__ = [
     "MakeSphericalMassEnclModel",
     "new_sphericalmassencl_model",
     "new_sphericalmassencl_sphere",
+    "plummer_invcdf",
 ]
 
 ##############################################################################
@@ -24,17 +26,31 @@ __all__ = [
 # GENERAL
 
 from types import FunctionType
+from typing import Optional
 
 import numpy as np
 import numpy.random
 
 from amuse import datamodel
 from amuse.units import units as u, nbody_system
+from amuse.units.quantities import is_quantity
 
 
 # PROJECT-SPECIFIC
 
-from ..utils import amuseify_array
+from ..utils import _set_store_values
+
+
+###############################################################################
+# PARAMETERS
+
+# size of the tabulated enclosed mass function: 32 points per particle,
+# clipped to these bounds
+_CDF_TABLE_MIN = 1000
+_CDF_TABLE_MAX = 200000
+
+# tile size for the coordinate conversion
+_CHUNK = 8192
 
 
 ###############################################################################
@@ -42,6 +58,103 @@ from ..utils import amuseify_array
 ###############################################################################
 
 
+def plummer_invcdf(x, r_pl):
+    """Inverse of the Plummer enclosed-mass fraction.
+
+    .. math::
+
+        r = r_{pl} (x^{-2/3} - 1)^{-1/2}
+
+    Parameters
+    ----------
+    x: ndarray
+        enclosed mass fraction, in [0, 1)
+    r_pl: distance quantity
+        the Plummer radius
+
+    Returns
+    -------
+    r: distance quantity ndarray
+
+    """
+    return r_pl * (np.power(x, -2.0 / 3.0) - 1.0) ** -0.5
+
+
+# /def
+
+
+def _velocity_magnitudes(pot_vals, vel_adj: float):
+    """Speeds from the potential, sqrt(|pot| / vel_adj).
+
+    Parameters
+    ----------
+    pot_vals: ndarray
+        unitless potential values
+    vel_adj: float
+
+    Returns
+    -------
+    speed: ndarray
+        float64, with units of sqrt(`pot_vals`)
+
+    """
+    speed = np.absolute(pot_vals, dtype=np.float64)
+    np.sqrt(speed, out=speed)
+    if vel_adj != 1.0:
+        speed *= 1.0 / np.sqrt(vel_adj)
+    return speed
+
+
+# /def
+
+
+def _spherical_to_cartesian(r, theta, phi, x, y, z):
+    """Convert spherical to Cartesian coordinates, in place.
+
+    Works in tiles of ``_CHUNK`` points, reusing one scratch buffer
+    for sin(theta), so the working set stays in cache.
+
+    Parameters
+    ----------
+    r, theta, phi : (N,) ndarray
+        radius, polar angle, and azimuthal angle
+    x, y, z : (N,) ndarray
+        where to write the Cartesian coordinates
+
+    Returns
+    -------
+    x, y, z : (N,) ndarray
+
+    """
+    sin_t = np.empty(min(len(r), _CHUNK))
+
+    for start in range(0, len(r), _CHUNK):
+        tile = slice(start, start + _CHUNK)
+        x_, y_, z_ = x[tile], y[tile], z[tile]
+        st = sin_t[: len(x_)]
+
+        np.sin(theta[tile], out=st)
+
+        np.cos(phi[tile], out=x_)
+        x_ *= st
+        x_ *= r[tile]
+
+        np.sin(phi[tile], out=y_)
+        y_ *= st
+        y_ *= r[tile]
+
+        np.cos(theta[tile], out=z_)
+        z_ *= r[tile]
+
+    return x, y, z
+
+
+# /def
+
+
+# --------------------------------------------------------------------------
+
+
 class MakeSphericalMassEnclModel(object):
     """Make Mass Model from Enclosed Mass Function.
 
@@ -64,8 +177,8 @@ class MakeSphericalMassEnclModel(object):
         # mass_cutoff=0.999,
         do_scale: bool = False,
         _vel_adj: float = 1.0,
-        random_state=None,
         random=None,
+        encl_mass_invcdf: Optional[FunctionType] = None,
     ):
         """Instantiate spatial / velocity distribution from enclosed mass.
 
@@ -77,32 +190,40 @@ class MakeSphericalMassEnclModel(object):
         vel_potential: amuse potential
             potential from which to sample for the velocities
             signature:: vel_potential(position)
+        encl_mass_invcdf: function, optional
+            analytic inverse of the enclosed mass function.
+            signature:: encl_mass_invcdf(u) -> R
+            where `u` is the fraction of the mass enclosed
+            within `radius_cutoff`. If given, replaces the tabulated
+            inverse of `encl_mass_func`. See ``plummer_invcdf``.
+        random: int or Generator, optional
+            random number generator, or seed for one.
+            defaults to ``np.random.default_rng()``
 
         """
         super().__init__()
 
         self.number_of_particles = number_of_particles
         self.encl_mass_func = encl_mass_func
+        self.encl_mass_invcdf = encl_mass_invcdf
         self.vel_potential = vel_potential
 
         self.convert_nbody = convert_nbody
         self.radius_cutoff = radius_cutoff
+        self._cdf_table = None  # made on first use
+        self._model = None  # sampled on first use
 
         # _tmp = self.calculate_mass_cuttof_from_radius_cutoff(radius_cutoff))
         # self.mass_cutoff = min(mass_cutoff, _tmp
         self.do_scale = do_scale
 
-        self._vel_adj = 1.0
-
-        if random_state is not None:
-            print("DO NOT USE RANDOM STATE")
-
-        self.random_state = None
+        self._vel_adj = float(_vel_adj)
 
-        if random is None:
-            self.random = np.random
-        else:
-            self.random = random
+        self.random = (
+            np.random.default_rng(random)
+            if random is None or isinstance(random, (int, np.integer))
+            else random
+        )
 
         return
 
@@ -120,38 +241,62 @@ class MakeSphericalMassEnclModel(object):
         Notes
         -----
         calls encl_mass_func(R), where R has units, and returns units
+        if `encl_mass_invcdf` is given, it is used instead.
 
         """
-        # radii, finely sampled to the cutoff
-        R_unit = self.radius_cutoff.unit
-        R = np.logspace(
-            -5,
-            np.log10(self.radius_cutoff.value_in(R_unit)),
-            num=max(10 * self.number_of_particles, 1e6),
-        )
+        if self.encl_mass_invcdf is not None:
+            us = self.random.uniform(0.0, 1.0, self.number_of_particles)
+            return self.encl_mass_invcdf(us)
 
-        # get enclosed masses for inverse sampling
-        sample_encl_mass = self.encl_mass_func(R | R_unit)
-        m_unit = sample_encl_mass.unit  # the mass unit
+        log_R, cdf, R_unit = self._get_cdf_table()
 
-        # inverse CDF transform  # TODO as separate function
-        cdf = sample_encl_mass.value_in(m_unit)  # cdf
+        # inverse CDF transform
         us = self.random.uniform(cdf[0], cdf[-1], self.number_of_particles)
-        # get sample from `us`
-        rs = (
-            np.array(
-                [
-                    R[np.argwhere(cdf == (cdf[(cdf - u) >= 0])[0])[0][0]]
-                    for u in us
-                ]
-            )
-            | R_unit
-        )
+        # get sample from `us`, interpolating linearly in log radius
+        # between the tabulated points, so the radii are not quantized
+        rs = np.exp(np.interp(us, cdf, log_R)) | R_unit
 
         return rs
 
     # /def
 
+    def _get_cdf_table(self):
+        """Tabulated enclosed mass function, made on first call.
+
+        Returns
+        -------
+        log_R: ndarray
+            log of the radii, finely sampled to the cutoff
+        cdf: ndarray
+            enclosed mass at the radii
+        R_unit: unit
+            units of the radii
+
+        """
+        if self._cdf_table is None:
+            # radii, finely sampled to the cutoff
+            R_unit = self.radius_cutoff.unit
+            R = np.logspace(
+                -5,
+                np.log10(self.radius_cutoff.value_in(R_unit)),
+                num=int(
+                    min(
+                        max(_CDF_TABLE_MIN, 32 * self.number_of_particles),
+                        _CDF_TABLE_MAX,
+                    )
+                ),
+            )
+
+            # get enclosed masses for inverse sampling
+            sample_encl_mass = self.encl_mass_func(R | R_unit)
+            cdf = sample_encl_mass.value_in(sample_encl_mass.unit)
+
+            self._cdf_table = (np.log(R), cdf, R_unit)
+
+        return self._cdf_table
+
+    # /def
+
     def new_positions_spherical_coordinates(self):
         """Create positions in spherical coordinates.
 
@@ -163,10 +308,7 @@ class MakeSphericalMassEnclModel(object):
 
         """
         radius = self.calculate_radius_invcdf_distribution()
-
-        num_objs = self.number_of_particles
-        theta = np.arccos(self.random.uniform(-1.0, 1.0, size=num_objs))
-        phi = self.random.uniform(0.0, np.pi ** 2, size=num_objs)
+        theta, phi = self._new_random_directions()
 
         return radius, theta, phi
 
@@ -192,23 +334,47 @@ class MakeSphericalMassEnclModel(object):
         adjusts velocity be 1 / sqrt(_vel_adj), default of 1.
 
         """
-        num_objs = self.number_of_particles
-
         # potential = km^2/s^2
         pot_at_pt = self.vel_potential.get_potential_at_point(0, x, y, z)
+        if is_quantity(pot_at_pt):
+            pot_at_pt = pot_at_pt.value_in(u.km ** 2 / u.s ** 2)
         # velocity
-        velocity = amuseify_array(
-            np.sqrt(np.abs(pot_at_pt) / self._vel_adj), to_unit=u.km / u.s
-        )
+        velocity = _velocity_magnitudes(pot_at_pt, self._vel_adj) | u.km / u.s
 
         # random directions
-        theta = np.arccos(self.random.uniform(-1.0, 1.0, size=num_objs))
-        phi = self.random.uniform(0.0, np.pi ** 2, size=num_objs)
+        theta, phi = self._new_random_directions()
 
         return velocity, theta, phi
 
     # /def
 
+    def _new_random_directions(self):
+        """Isotropic random directions.
+
+        Both angles are made from a single draw of uniform numbers.
+
+        Returns
+        -------
+        theta: ndarray
+            polar angle in [0, pi], in radians
+        phi: ndarray
+            azimuthal angle in [0, 2 pi), in radians
+
+        """
+        us = self.random.uniform(0.0, 1.0, size=(2, self.number_of_particles))
+
+        theta = us[0]
+        theta *= 2.0
+        theta -= 1.0
+        np.arccos(theta, out=theta)
+
+        phi = us[1]
+        phi *= 2.0 * np.pi
+
+        return theta, phi
+
+    # /def
+
     def coordinates_from_spherical(self, radius: u.kpc, theta, phi):
         """Convert Coordinates to Cartesian from Spherical Coords.
 
@@ -219,40 +385,66 @@ class MakeSphericalMassEnclModel(object):
 
         """
         R_unit = radius.unit
-        x = (radius * np.sin(theta) * np.cos(phi)).in_(R_unit)
-        y = (radius * np.sin(theta) * np.sin(phi)).in_(R_unit)
-        z = (radius * np.cos(theta)).in_(R_unit)
+        r = radius.value_in(R_unit)
 
-        return x, y, z
+        # compute on the unitless arrays
+        x, y, z = np.empty(len(r)), np.empty(len(r)), np.empty(len(r))
+        _spherical_to_cartesian(r, theta, phi, x, y, z)
+
+        return x | R_unit, y | R_unit, z | R_unit
 
     # /def
 
-    def new_model(self):
+    def new_model(self, resample: bool = False):
         """Make New Model.
 
+        The model is sampled once and cached, so `new_model` and `result`
+        share the same draw.
+
+        Parameters
+        ----------
+        resample: bool, optional
+            whether to draw a new model, replacing the cached one.
+
         Returns
         -------
         m: ndarray
             masses
-        position: ndarray
-        velocity: ndarray
+        position: tuple
+            (x, y, z) distance quantity arrays
+        velocity: tuple
+            (vx, vy, vz) speed quantity arrays
+
+        """
+        if resample or self._model is None:
+            self._model = self._sample_positions_velocities()
+        return self._model
+
+    # /def
+
+    def _sample_positions_velocities(self):
+        """Sample the masses, positions, and velocities.
+
+        Returns
+        -------
+        m: ndarray
+        position: tuple
+        velocity: tuple
 
         """
         num_objs = self.number_of_particles
 
-        m = np.zeros((num_objs, 1)) + (1.0 / num_objs)
+        m = np.full(num_objs, 1.0 / num_objs)
 
         # position
         radius, theta, phi = self.new_positions_spherical_coordinates()
         x, y, z = self.coordinates_from_spherical(radius, theta, phi)
-        position = np.hstack(x, y, z)
 
         # velocity
-        radius, theta, phi = self.new_velocities_spherical_coordinates(x, y, z)
-        x, y, z = self.coordinates_from_spherical(radius, theta, phi)
-        velocity = np.hstack(x, y, z)
+        speed, theta, phi = self.new_velocities_spherical_coordinates(x, y, z)
+        vx, vy, vz = self.coordinates_from_spherical(speed, theta, phi)
 
-        return m, position, velocity
+        return m, (x, y, z), (vx, vy, vz)
 
     # /def
 
@@ -268,39 +460,25 @@ class MakeSphericalMassEnclModel(object):
         """
         num_objs = self.number_of_particles
 
-        masses = np.ones(num_objs) / num_objs
-        print("made masses")
+        masses, (x, y, z), (vx, vy, vz) = self.new_model()
+        masses = masses | u.MSun  # TODO FIX
+        radius = np.zeros(num_objs) | u.AU
 
-        radius, theta, phi = self.new_positions_spherical_coordinates()
-        x, y, z = self.coordinates_from_spherical(radius, theta, phi)
-        print("made coordinates")
-
-        speed, theta, phi = self.new_velocities_spherical_coordinates(x, y, z)
-        vx, vy, vz = self.coordinates_from_spherical(speed, theta, phi)
-        print("made velocities")
+        # build directly in generic units, rather than converting a copy
+        if self.convert_nbody is not None:
+            to_nbody = self.convert_nbody.to_nbody
+            masses, radius = to_nbody(masses), to_nbody(radius)
+            x, y, z = to_nbody(x), to_nbody(y), to_nbody(z)
+            vx, vy, vz = to_nbody(vx), to_nbody(vy), to_nbody(vz)
 
         # ---------------
-        # build Particles
+        # build Particles, setting all the attributes at once
         result = datamodel.Particles(num_objs)
-        # result.mass = nbody_system.mass.new_quantity(masses)
-        result.mass = masses | u.MSun  # TODO FIX
-        # spatial
-        # result.x = nbody_system.length.new_quantity(x.reshape(num_objs))
-        # result.y = nbody_system.length.new_quantity(y.reshape(num_objs))
-        # result.z = nbody_system.length.new_quantity(z.reshape(num_objs))
-        result.x = x.reshape(num_objs)
-        result.y = y.reshape(num_objs)
-        result.z = z.reshape(num_objs)
-        # velocity
-        # result.vx = nbody_system.speed.new_quantity(vx.reshape(num_objs))
-        # result.vy = nbody_system.speed.new_quantity(vy.reshape(num_objs))
-        # result.vz = nbody_system.speed.new_quantity(vz.reshape(num_objs))
-        result.vx = vx.reshape(num_objs)
-        result.vy = vy.reshape(num_objs)
-        result.vz = vz.reshape(num_objs)
-        # radius
-        # result.radius = 0 | nbody_system.length
-        result.radius = 0 | u.AU
+        _set_store_values(
+            result,
+            ["mass", "x", "y", "z", "vx", "vy", "vz", "radius"],
+            [masses, x, y, z, vx, vy, vz, radius],
+        )
 
         # ---------------
 
@@ -309,11 +487,6 @@ class MakeSphericalMassEnclModel(object):
         if self.do_scale:
             result.scale_to_standard()
 
-        if self.convert_nbody is not None:
-            converter = self.convert_nbody.as_converter_from_si_to_generic()
-            result = datamodel.ParticlesWithUnitsConverted(result, converter)
-            result = result.copy()
-
         return result
 
     # /def
@@ -29,8 +29,9 @@ __all__ = [
 
 # GENERAL
 
-import copy
-from collections import namedtuple
+import inspect
+import math
+from collections import OrderedDict, namedtuple
 from typing import Tuple, Any, Callable
 
 import numpy as np
@@ -55,7 +56,8 @@ else:
 # PROJECT-SPECIFIC
 
 from . import initialize_system
-from ..units import to_amuse_decorator
+from ..datamodel import System
+from ..utils import _get_store_values
 
 
 ###############################################################################
@@ -68,34 +70,28 @@ SC_Tuple = namedtuple(
 
 _LOGFILE = LogFile(header=False)
 
+# particles per tile in the radial cut, so a tile's arrays fit in L2 cache
+_CHUNK = 8192
+
 
 ###############################################################################
 # CODE
 ###############################################################################
 
 
+# inputs are converted to AMUSE units by ``initialize_system``
 @store_function_input(store_inputs=True)
-@to_amuse_decorator(  # ensure inputs are in AMUSE units
-    arguments=[
-        "Rvirial",
-        "position",
-        "velocity",
-        "obj_radius",
-        "smoothing_length",
-        "timestep",
-    ]
-)
 def initialize_star_cluster(
     number_of_particles: (int, Particles),
     *,  # must use kwargs
     # for IMF
     imf_func: (bool, Callable) = True,
-    imf_args: list = [],
-    imf_kwargs: dict = {},
+    imf_args: (list, tuple, None) = None,
+    imf_kwargs: (dict, None) = None,
     # for distribution function
     distr_func: (bool, Callable) = True,
-    distr_args: list = [],
-    distr_kwargs: dict = {},
+    distr_args: (list, tuple, None) = None,
+    distr_kwargs: (dict, None) = None,
     # object properties
     Rvirial: amu.parsec = 10 | amu.parsec,
     position: amu.kpc = [0, 0, 0] | amu.kpc,
@@ -103,11 +99,11 @@ def initialize_star_cluster(
     obj_radius: amu.AU = 0 | amu.AU,  # size of each object
     # for evolution
     evln_func: (bool, Callable) = False,
-    evln_kwargs: dict = {},
+    evln_kwargs: (dict, None) = None,
     # for gravity
     gravity_func: (bool, Callable) = False,
-    gravity_args: list = [],
-    gravity_kwargs: dict = {},
+    gravity_args: (list, tuple, None) = None,
+    gravity_kwargs: (dict, None) = None,
     smoothing_length: amu.parsec = 0.0 | amu.parsec,
     opening_angle: float = 0.6,
     number_of_workers: int = 8,
@@ -292,12 +288,12 @@ def _initialize_star_cluster_bound(
     *,  # must use kwargs
     # for IMF
     imf_func: (bool, Callable) = True,
-    imf_args: list = [],
-    imf_kwargs: dict = {},
+    imf_args: (list, tuple, None) = None,
+    imf_kwargs: (dict, None) = None,
     # for distribution function
     distr_func: (bool, Callable) = True,
-    distr_args: list = [],
-    distr_kwargs: dict = {},
+    distr_args: (list, tuple, None) = None,
+    distr_kwargs: (dict, None) = None,
     # object properties
     Rvirial: amu.parsec = 10 | amu.parsec,
     position: amu.kpc = [0, 0, 0] | amu.kpc,
@@ -305,11 +301,11 @@ def _initialize_star_cluster_bound(
     obj_radius: amu.AU = 0 | amu.AU,  # size of each object
     # for evolution
     evln_func: (bool, Callable) = False,
-    evln_kwargs: dict = {},
+    evln_kwargs: (dict, None) = None,
     # for gravity
     gravity_func: (bool, Callable) = False,
-    gravity_args: list = [],
-    gravity_kwargs: dict = {},
+    gravity_args: (list, tuple, None) = None,
+    gravity_kwargs: (dict, None) = None,
     smoothing_length: amu.parsec = 0.0 | amu.parsec,
     opening_angle: float = 0.6,
     number_of_workers: int = 8,
@@ -486,6 +482,7 @@ def _initialize_star_cluster_unbound(
     bound_system_func: Callable,
     bound_radius=None,  # TODO should None be allowable?
     init_arg: Tuple[str, Any] = ("number_of_particles", 2),
+    full_init: (bool, None) = None,
 ) -> tuple:
     """Initialize unbound system from Contenta (2018) star cluster.
 
@@ -504,38 +501,58 @@ def _initialize_star_cluster_unbound(
     init_arg : Tuple[str, Any], optional
         the arguments needed to make the smallest version of the star cluster
         default is ("number_of_particles", 2)
+    full_init : bool or None, optional
+        whether to make the unbound cluster with `bound_system_func`,
+        which starts its own evolution and gravity codes.
+        if False, the unbound cluster is only an empty particle set.
+        if None (default), True only if `bound_cluster` has evolution or
+        gravity codes.
 
     Returns
     -------
     unbound_cluster : System
-    unbound_inputs : BoundArguments
+    unbound_inputs : BoundArguments or None
+        None if not `full_init`
 
     """
+    if full_init is None:
+        full_init = (getattr(bound_cluster, "gravity", None) is not None) or (
+            getattr(bound_cluster, "evolution", None) is not None
+        )
 
-    ba = copy.copy(bound_inputs)
-
-    ba.arguments[init_arg[0]] = init_arg[1]  # need to initialize, then remove
-
-    (unbound_cluster, unbound_inputs,) = bound_system_func(
-        *ba.args, store_inputs=False, **ba.kwargs
-    )
+    if full_init:
+        # fresh arguments, so the bound inputs are not modified
+        arguments = OrderedDict(bound_inputs.arguments)
+        arguments[init_arg[0]] = init_arg[1]  # need to initialize, then remove
+        ba = inspect.BoundArguments(bound_inputs.signature, arguments)
 
-    # remove initialization particles
-    unbound_cluster.particles.remove_particles(unbound_cluster.particles)
-    if unbound_cluster.gravity is not None:
-        unbound_cluster.gravity.particles.synchronize_to(
-            unbound_cluster.particles
+        (unbound_cluster, unbound_inputs,) = bound_system_func(
+            *ba.args, store_inputs=False, **ba.kwargs
         )
-    if unbound_cluster.evolution is not None:
-        unbound_cluster.evolution.particles.synchronize_to(
-            unbound_cluster.particles
+
+        # remove initialization particles
+        unbound_cluster.particles.remove_particles(unbound_cluster.particles)
+        if unbound_cluster.gravity is not None:
+            unbound_cluster.gravity.particles.synchronize_to(
+                unbound_cluster.particles
+            )
+        if unbound_cluster.evolution is not None:
+            unbound_cluster.evolution.particles.synchronize_to(
+                unbound_cluster.particles
+            )
+
+    else:  # no codes needed, so skip making (then emptying) a cluster
+        unbound_cluster = System(
+            particles=Particles(),
+            converter=getattr(bound_cluster, "converter", None),
         )
+        unbound_inputs = None
 
     # find bound & unbound particles
     if bound_radius is None:
         bound_radius = bound_cluster.bound_radius_cutoff
     bound_cluster, unbound_cluster, _ = separate_bound_unbound(
-        bound_cluster, unbound_cluster, bound_cluster.bound_radius_cutoff
+        bound_cluster, unbound_cluster, bound_radius
     )
 
     return unbound_cluster, unbound_inputs
@@ -547,12 +564,75 @@ def _initialize_star_cluster_unbound(
 # -------------------------------------------------------------------
 
 
+def _synchronize_codes(system):
+    """Synchronize the gravity and evolution codes to the particles.
+
+    Parameters
+    ----------
+    system : System
+        codes that are None or missing are skipped
+
+    """
+    for name in ("gravity", "evolution"):
+        code = getattr(system, name, None)
+        if code is not None:
+            system.particles.synchronize_to(code.particles)
+
+
+# /def
+
+
+def _radial_mask(x, y, z, threshold, out):
+    """Mask of points with squared radius beyond `threshold`.
+
+    Works in tiles of ``_CHUNK`` points, reusing two scratch buffers,
+    so no temporaries are allocated per tile.
+
+    Parameters
+    ----------
+    x, y, z : (N,) ndarray
+    threshold : float
+        the squared radius
+    out : (N,) bool ndarray
+        where to write the mask
+
+    Returns
+    -------
+    out : (N,) bool ndarray
+
+    """
+    r2 = np.empty(min(len(x), _CHUNK))
+    tmp = np.empty_like(r2)
+
+    for start in range(0, len(x), _CHUNK):
+        tile = slice(start, start + _CHUNK)
+        n = len(x[tile])
+        r2_, tmp_ = r2[:n], tmp[:n]
+
+        np.multiply(x[tile], x[tile], out=r2_)
+        np.multiply(y[tile], y[tile], out=tmp_)
+        r2_ += tmp_
+        np.multiply(z[tile], z[tile], out=tmp_)
+        r2_ += tmp_
+        np.greater(r2_, threshold, out=out[tile])
+
+    return out
+
+
+# /def
+
+
 def separate_bound_unbound(
-    bound_cluster, unbound_cluster, bound_radius, cdf_code=None, converter=None
+    bound_cluster,
+    unbound_cluster,
+    bound_radius,
+    cdf_code=None,
+    converter=None,
+    use_density_center: bool = True,
 ):
     """Separate Unbound particles from Bound Particles.
 
-    Uses a simple radius cut from the center of mass.
+    Uses a simple radius cut from the density center (or center of mass).
 
     Also reset cdf_code parameters, if provided.
 
@@ -563,56 +643,66 @@ def separate_bound_unbound(
     cdf_code : DynamicalFrictionClass, optional
         reset the total_mass
     converter: nbody_to_si
-        needed if cdf_code is not None and bound_cluster
-        does not have a method `.converter`
+        needed if `cdf_code` is not None or `use_density_center`,
+        and bound_cluster does not have a method `.converter`
+    use_density_center : bool, optional
+        whether to cut from the density center (default),
+        or the cheaper center of mass.
 
     """
-    if converter is None:
+    if converter is None and (use_density_center or cdf_code is not None):
         if hasattr(bound_cluster, "converter"):
             converter = bound_cluster.converter
         else:
-            raise ValueError("need a `converter` if `cdf_code` is not None")
+            raise ValueError(
+                "need a `converter` if `cdf_code` is not None "
+                "or `use_density_center`"
+            )
     else:
         pass  # assume in correct format
 
-    # find density center
-    # use instead of center of mass b/c less sensitive to filling the orbit donut.
-    (
-        densitycentre,
-        coreradius,
-        coredens,
-    ) = bound_cluster.particles.densitycentre_coreradius_coredens(
-        unit_converter=converter
-    )
-    rcenter = np.linalg.norm(densitycentre)
+    if use_density_center:
+        # find density center
+        # use instead of center of mass b/c less sensitive to filling the
+        # orbit donut.
+        (
+            center,
+            coreradius,
+            coredens,
+        ) = bound_cluster.particles.densitycentre_coreradius_coredens(
+            unit_converter=converter
+        )
+    else:
+        center = bound_cluster.particles.center_of_mass()
+    dc = center.value_in(amu.pc)
+    rcenter_pc = math.sqrt(dc[0] * dc[0] + dc[1] * dc[1] + dc[2] * dc[2])
 
     # find bound & unbound particles
     # TODO plot what is and isn't bound
     # subset = bound_cluster.particles.bound_subset(
     #     unit_converter=bound_cluster.converter,
     # )
-    unbound = bound_cluster.particles.select_array(
-        lambda p: np.linalg.norm(p.value_in(amu.pc), axis=-1)
-        > rcenter.value_in(amu.pc) + bound_radius.value_in(amu.pc),
-        ["position"],
+    # compare squared radii, no sqrt
+    # per-axis arrays (SoA), summed in-place, in cache-sized tiles
+    # one store access for all three axes
+    particles = bound_cluster.particles
+    x, y, z = (
+        q.value_in(amu.pc)
+        for q in _get_store_values(particles, ["x", "y", "z"])
     )
 
+    threshold = (rcenter_pc + bound_radius.value_in(amu.pc)) ** 2
+    mask = _radial_mask(x, y, z, threshold, out=np.empty(len(x), dtype=bool))
+
+    unbound = particles[mask]
+
     # move particles that left the cluster to `unbound`
     unbound_cluster.particles.add_particles(unbound)
-    unbound_cluster.particles.channel_to.gravity.copy()
+    _synchronize_codes(unbound_cluster)
 
     # remove unbound particles from cluster so don't do dynfric
     bound_cluster.particles.remove_particles(unbound)
-    try:
-        bound_cluster.particles.synchronize_to(bound_cluster.gravity.particles)
-    except AttributeError:  # don't have gravity
-        pass
-    try:
-        bound_cluster.particles.synchronize_to(
-            bound_cluster.evolution.particles
-        )
-    except AttributeError:  # don't have gravity
-        pass
+    _synchronize_codes(bound_cluster)
 
     # update mass of cluster in dynamical friction code
     if cdf_code is not None:
@@ -620,8 +710,11 @@ def separate_bound_unbound(
         rhm = bound_cluster.particles.LagrangianRadii(
             mf=[0.5], unit_converter=converter
         )[0]
+        total_mass = (
+            bound_cluster.particles.mass.value_in(amu.MSun).sum() | amu.MSun
+        )
         cdf_code.reset_parameters(
-            GMs=bound_cluster.particles.total_mass(), rhm=rhm,  # half-mass
+            GMs=total_mass, rhm=rhm,  # half-mass
         )
 
     return bound_cluster, unbound_cluster, cdf_code
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for :mod:`~amuse_util.ic.brokenimf`."""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+# IMPORTS
+
+# GENERAL
+
+import gc
+import weakref
+
+import numpy as np
+
+from amuse.units import units as u
+
+
+# PROJECT-SPECIFIC
+
+from ..brokenimf import (
+    _broken_power_law_template,
+    new_kroupa_mass_distribution,
+)
+
+
+##############################################################################
+# PARAMETERS
+
+# the undecorated IMF
+kroupa = new_kroupa_mass_distribution.__wrapped__
+
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+def test_random_state_draws():
+    """Equal seeds draw equal masses, through one cached template."""
+    _broken_power_law_template.cache_clear()
+    m1 = kroupa(100, random=np.random.RandomState(0)).value_in(u.MSun)
+    m2 = kroupa(100, random=np.random.RandomState(0)).value_in(u.MSun)
+
+    assert np.array_equal(m1, m2)
+    assert _broken_power_law_template.cache_info().currsize == 1
+
+
+# /def
+
+
+def test_random_state_not_cached():
+    """The cache does not keep the random number generator alive."""
+
+    class RandomState(np.random.RandomState):  # weak-referenceable
+        pass
+
+    random = RandomState(0)
+    ref = weakref.ref(random)
+    kroupa(10, random=random)
+
+    del random
+    gc.collect()
+    assert ref() is None
+
+
+# /def
+
+
+def test_evenly_distributed():
+    """A falsy `random` gives the evenly distributed grid."""
+    masses = kroupa(10, random=False).value_in(u.MSun)
+
+    assert np.array_equal(masses, kroupa(10, random=0).value_in(u.MSun))
+    assert np.all(np.diff(masses) > 0)
+
+
+# /def
+
+
+##############################################################################
+# END
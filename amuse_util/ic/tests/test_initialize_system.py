@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for :mod:`~amuse_util.ic._initialize_system`."""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+# IMPORTS
+
+# GENERAL
+
+import inspect
+
+import numpy as np
+
+from amuse.datamodel import Particles
+from amuse.units import units as u
+
+
+# PROJECT-SPECIFIC
+
+from .._initialize_system import _light_inputs, _shift, _signature
+
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+def test_shift():
+    """Each particle is shifted by the offset, in particle order."""
+    particles = Particles(3)
+    particles.position = [
+        [1.0, 0.0, 0.0],
+        [2.0, 0.0, 0.0],
+        [3.0, 0.0, 0.0],
+    ] | u.pc
+    particles.remove_particle(particles[0])  # store indices != positions
+
+    _shift(particles, ("x", "y", "z"), [1.0, 2.0, 3.0] | u.pc)
+
+    assert np.array_equal(
+        particles.position.value_in(u.pc),
+        [[3.0, 2.0, 3.0], [4.0, 2.0, 3.0]],
+    )
+    assert particles[0].x.value_in(u.pc) == 3.0
+
+
+# /def
+
+
+def test_signature_unhashable():
+    """Unhashable callables are not cached, but still have signatures."""
+
+    class Unhashable:
+        __hash__ = None
+
+        def __call__(self, a, b=1):
+            pass
+
+    def func(a, b=1):
+        pass
+
+    assert str(_signature(Unhashable())) == "(a, b=1)"
+    assert _signature(func) is _signature(func)
+
+
+# /def
+
+
+def test_light_inputs():
+    """Only optional keyword particles are dropped; positions are kept."""
+
+    def code(converter, particles, *, stars=None, mode="x", **kw):
+        pass
+
+    particles = Particles(2)
+    ba = inspect.signature(code).bind(
+        1, particles, stars=particles, mode="y", extra=particles, other=2
+    )
+    light = _light_inputs(ba)
+
+    assert light.args == (1, particles)
+    assert light.kwargs == {"mode": "y", "other": 2}
+
+
+# /def
+
+
+##############################################################################
+# END
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for :mod:`~amuse_util.ic.invcdf`."""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+# IMPORTS
+
+# GENERAL
+
+import numpy as np
+import pytest
+
+from amuse.units import units as u
+
+
+# PROJECT-SPECIFIC
+
+from ..invcdf import MakeSphericalMassEnclModel, plummer_invcdf
+
+
+##############################################################################
+# PARAMETERS
+
+R_PL = 1 | u.kpc
+RTOL = 1e-3
+
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+def plummer_encl_mass(r):
+    """Plummer enclosed-mass fraction."""
+    x = r.value_in(u.kpc) / R_PL.value_in(u.kpc)
+    return (x ** 3 / (1.0 + x ** 2) ** 1.5) | u.MSun
+
+
+# /def
+
+
+class KeplerPotential:
+    """Point-mass potential, with units of (km/s)^2."""
+
+    def get_potential_at_point(self, eps, x, y, z):
+        r = (x * x + y * y + z * z).sqrt().value_in(u.kpc)
+        return -1e4 / r | u.km ** 2 / u.s ** 2
+
+
+# /class
+
+
+# --------------------------------------------------------------------------
+
+
+def test_result_matches_model():
+    """Each particle gets its own sampled position and velocity."""
+    model = MakeSphericalMassEnclModel(
+        100, plummer_encl_mass, KeplerPotential(), random=0
+    )
+    _, (x, y, z), (vx, vy, vz) = model.new_model()
+    result = model.result
+
+    for got, want, unit in (
+        (result.x, x, u.kpc),
+        (result.z, z, u.kpc),
+        (result.vy, vy, u.kms),
+    ):
+        want = want.value_in(unit)
+        assert np.allclose(got.value_in(unit), want - want.mean())
+
+
+# /def
+
+
+@pytest.mark.parametrize("number_of_particles", [10, 1000, 10000])
+def test_tabulated_invcdf_converges_to_plummer(number_of_particles):
+    """The tabulated inverse matches the analytic Plummer inverse."""
+    cutoff = 100 | u.kpc
+    mass_cutoff = plummer_encl_mass(cutoff).value_in(u.MSun)
+
+    tabulated = MakeSphericalMassEnclModel(
+        number_of_particles,
+        plummer_encl_mass,
+        KeplerPotential(),
+        radius_cutoff=cutoff,
+        random=0,
+    )
+    analytic = MakeSphericalMassEnclModel(
+        number_of_particles,
+        plummer_encl_mass,
+        KeplerPotential(),
+        radius_cutoff=cutoff,
+        random=0,
+        # fraction of the mass within the cutoff
+        encl_mass_invcdf=lambda us: plummer_invcdf(us * mass_cutoff, R_PL),
+    )
+
+    got = tabulated.calculate_radius_invcdf_distribution().value_in(u.kpc)
+    want = analytic.calculate_radius_invcdf_distribution().value_in(u.kpc)
+
+    assert np.allclose(got, want, rtol=RTOL)
+
+
+# /def
+
+
+##############################################################################
+# END
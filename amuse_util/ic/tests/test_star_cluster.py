@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for :mod:`~amuse_util.ic.star_cluster`."""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+# IMPORTS
+
+# GENERAL
+
+import numpy as np
+
+from amuse.datamodel import Particles
+from amuse.units import units as u
+
+
+# PROJECT-SPECIFIC
+
+from ...datamodel import System
+from ..star_cluster import separate_bound_unbound
+
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+def test_separate_bound_unbound_system():
+    """Particles beyond the bound radius move to the unbound System."""
+    particles = Particles(4)
+    particles.mass = 1 | u.MSun
+    particles.position = [
+        [0.0, 0.0, 0.0],
+        [1.0, 0.0, 0.0],
+        [-1.0, 0.0, 0.0],
+        [50.0, 0.0, 0.0],
+    ] | u.pc
+    particles.velocity = [0.0, 0.0, 0.0] | u.kms
+    far_key = particles[3].key
+
+    bound = System(particles=particles)
+    unbound = System(particles=Particles())
+
+    bound, unbound, _ = separate_bound_unbound(
+        bound, unbound, 10 | u.pc, use_density_center=False
+    )
+
+    assert len(bound.particles) == 3
+    assert len(unbound.particles) == 1
+    assert unbound.particles[0].key == far_key
+    assert np.all(bound.particles.x.value_in(u.pc) < 10)
+
+
+# /def
+
+
+def test_separate_bound_unbound_synchronizes_codes():
+    """Codes are synchronized to the particles after the cut."""
+
+    class Code:
+        def __init__(self):
+            self.particles = Particles()
+
+    particles = Particles(2)
+    particles.mass = 1 | u.MSun
+    particles.position = [[0.0, 0.0, 0.0], [50.0, 0.0, 0.0]] | u.pc
+    particles.velocity = [0.0, 0.0, 0.0] | u.kms
+
+    gravity = Code()
+    gravity.particles.add_particles(particles)
+    bound = System(particles=particles, gravity=gravity)
+    unbound = System(particles=Particles(), gravity=Code())
+
+    bound, unbound, _ = separate_bound_unbound(
+        bound, unbound, 10 | u.pc, use_density_center=False
+    )
+
+    assert len(bound.gravity.particles) == 1
+    assert len(unbound.gravity.particles) == 1
+
+
+# /def
+
+
+##############################################################################
+# END
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for :mod:`~amuse_util.ic.utils`."""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+# IMPORTS
+
+# GENERAL
+
+import numpy as np
+import pytest
+
+from amuse.units import units as u
+
+
+# PROJECT-SPECIFIC
+
+from ..brokenimf import new_kroupa_mass_distribution
+from ..utils import (
+    build_imf_mass_table,
+    num_particles_from_mtot_given_mass_func,
+)
+
+
+##############################################################################
+# PARAMETERS
+
+# the undecorated IMF
+kroupa = new_kroupa_mass_distribution.__wrapped__
+
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+def test_num_particles_evenly_distributed():
+    """With a falsy `random` the IMF is a grid, so each N is drawn."""
+    N, M, err = num_particles_from_mtot_given_mass_func(
+        1e3 | u.MSun, kroupa, random=0
+    )
+
+    assert kroupa(N, random=0).sum().value_in(u.MSun) == M.value_in(u.MSun)
+    assert err < 1e-3
+    # neighbours are no closer
+    for n in (N - 1, N + 1):
+        m = kroupa(n, random=0).sum().value_in(u.MSun)
+        assert abs(m - 1e3) >= abs(M.value_in(u.MSun) - 1e3)
+
+
+# /def
+
+
+def test_num_particles_random():
+    """With random draws, N is the closest prefix of one sample."""
+    N, M, err = num_particles_from_mtot_given_mass_func(
+        1e3 | u.MSun, kroupa, random=np.random.RandomState(0)
+    )
+
+    masses = kroupa(
+        2 * N, random=np.random.RandomState(0)
+    ).value_in(u.MSun)
+    assert np.isclose(masses[:N].sum(), M.value_in(u.MSun))
+    assert err < 1e-2
+
+
+# /def
+
+
+def test_imf_decorator_mass_evenly_distributed():
+    """A total mass returns the full IMF grid, not its lightest stars."""
+    masses = new_kroupa_mass_distribution(1e3 | u.MSun, random=0)
+    N, _, _ = num_particles_from_mtot_given_mass_func(
+        1e3 | u.MSun, kroupa, random=0
+    )
+
+    assert len(masses) == N
+    assert np.array_equal(
+        masses.value_in(u.MSun), kroupa(N, random=0).value_in(u.MSun)
+    )
+    assert np.isclose(masses.max().value_in(u.MSun), 100.0)
+
+
+# /def
+
+
+def test_build_imf_mass_table():
+    """The table gives the closest prefix, and needs random draws."""
+    table = build_imf_mass_table(kroupa, 5000, random=np.random.RandomState(0))
+    N, M, _ = num_particles_from_mtot_given_mass_func(
+        1e3 | u.MSun, kroupa, table=table
+    )
+    assert M.value_in(u.MSun) == table[N - 1]
+
+    with pytest.raises(ValueError):
+        build_imf_mass_table(kroupa, 5000, random=0)
+
+
+# /def
+
+
+def test_num_particles_zero_mass():
+    """A zero target mass is rejected, not divided by."""
+    with pytest.raises(AssertionError):
+        num_particles_from_mtot_given_mass_func(0 | u.MSun, kroupa)
+
+
+# /def
+
+
+##############################################################################
+# END
@@ -4,6 +4,7 @@
 
 Routine Listings
 ----------------
+`build_imf_mass_table`
 `num_particles_from_mtot_given_mass_func`
 `imf_number_of_particles_decorator`
 
@@ -13,6 +14,7 @@ __author__ = "Nathaniel Starkman"
 
 
 __all__ = [
+    "build_imf_mass_table",
     "num_particles_from_mtot_given_mass_func",
     "imf_number_of_particles_decorator"
 ]
@@ -44,6 +46,207 @@ from utilipy.utils.functools import wraps, partial
 ##############################################################################
 
 
+def _search_N(csum: np.ndarray, target: float) -> int:
+    """Number of elements whose cumulative sum is closest to `target`.
+
+    Parameters
+    ----------
+    csum: ndarray
+        monotonically increasing cumulative sum
+    target: float
+        must be at most ``csum[-1]``
+
+    Returns
+    -------
+    N: int
+        ``csum[N - 1]`` is closest to `target`
+
+    """
+    K = int(np.searchsorted(csum, target))  # csum[K-1] < target <= csum[K]
+    # K elements are below target, K + 1 are at or above
+    if K == 0 or (csum[K] - target) < (target - csum[K - 1]):
+        return K + 1
+    return K
+
+
+# /def
+
+
+def _imf_sample_covering(
+    target: float,
+    imf_func: Callable,
+    imf_args: list,
+    imf_kwargs: dict,
+    random,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """One IMF sample whose total mass covers `target`.
+
+    Parameters
+    ----------
+    target: float
+        target mass, in MSun
+    imf_func: function
+        signature: ``imf_func(number_of_particles, *args, **kwargs)``
+    imf_args: list
+    imf_kwargs: dict
+    random: number
+
+    Returns
+    -------
+    masses: ndarray
+        the sample masses, in MSun
+    csum: ndarray
+        cumulative sum of `masses`
+
+    """
+    # start from a small sample, which also gives the mean mass
+    masses = imf_func(1000, *imf_args, random=random, **imf_kwargs).value_in(
+        u.MSun
+    )
+    csum = np.cumsum(masses)
+
+    # extend the sample until it covers the target mass,
+    # guessing the number of stars needed from the mean mass (+10%)
+    while csum[-1] < target:
+        N = int(1.1 * (target - csum[-1]) / (csum[-1] / len(csum))) + 1
+        extra = imf_func(N, *imf_args, random=random, **imf_kwargs).value_in(
+            u.MSun
+        )
+        masses = np.concatenate((masses, extra))
+        csum = np.concatenate((csum, csum[-1] + np.cumsum(extra)))
+
+    return masses, csum
+
+
+# /def
+
+
+def _search_N_per_draw(
+    target: float,
+    imf_func: Callable,
+    imf_args: list,
+    imf_kwargs: dict,
+    random,
+) -> Tuple[int, float]:
+    """Number of particles, drawing a new IMF sample for each N.
+
+    For an `imf_func` whose draws are not i.i.d., e.g. the evenly
+    distributed grid of ``MultiplePartIMF`` when `random` is falsy,
+    the first N masses of a larger sample are not a sample of N stars.
+
+    Parameters
+    ----------
+    target: float
+        target mass, in MSun
+    imf_func: function
+        signature: ``imf_func(number_of_particles, *args, **kwargs)``
+    imf_args: list
+    imf_kwargs: dict
+    random: number
+
+    Returns
+    -------
+    N: int
+        mass of ``imf_func(N)`` is closest to `target`
+    M: float
+        mass of ``imf_func(N)``, in MSun
+
+    """
+
+    def _mass(N: int) -> float:
+        return (
+            imf_func(N, *imf_args, random=random, **imf_kwargs)
+            .value_in(u.MSun)
+            .sum()
+        )
+
+    # figuring out good guess from the total / mean mass
+    N = max(int(target / (_mass(1000) / 1000)), 1)
+
+    # bracket the target: M(N_low) < target <= M(N_up)
+    N_low, M_low = N, _mass(N)
+    while (M_low >= target) and (N_low > 1):
+        N_low //= 2
+        M_low = _mass(N_low)
+    if M_low >= target:  # a single star suffices
+        return N_low, M_low
+
+    N_up, M_up = 2 * N_low, _mass(2 * N_low)
+    while M_up < target:
+        N_low, M_low = N_up, M_up
+        N_up *= 2
+        M_up = _mass(N_up)
+
+    # bisect
+    while N_up - N_low > 1:
+        N = (N_low + N_up) // 2
+        M = _mass(N)
+        if M < target:
+            N_low, M_low = N, M
+        else:
+            N_up, M_up = N, M
+
+    if (M_up - target) < (target - M_low):
+        return N_up, M_up
+    return N_low, M_low
+
+
+# /def
+
+
+def build_imf_mass_table(
+    imf_func: Callable,
+    N_max: int,
+    *imf_args: Any,
+    random=True,
+    **imf_kwargs: Any
+) -> np.ndarray:
+    """Cumulative mass table of one IMF sample.
+
+    For many calls to `num_particles_from_mtot_given_mass_func` with the
+    same IMF and different target masses.
+
+    Parameters
+    ----------
+    imf_func: function
+        the function that generates the IMF
+        signature: ``imf_func(number_of_particles, *args, **kwargs)``
+    N_max: int
+        the number of stars in the sample.
+        sets the largest mass the table covers.
+    *imf_args
+        arguments for `imf_func`
+    random: number
+        the random seed
+        for reproducibility
+        must be truthy, so the draws are i.i.d.
+    **imf_kwargs
+        keyword arguments for `imf_func`
+
+    Returns
+    -------
+    table: (N_max, ) ndarray
+        mass of the first N stars, in MSun, at index N - 1
+
+    Raises
+    ------
+    ValueError
+        if `random` is falsy
+
+    """
+    if not random:
+        raise ValueError("a mass table needs random draws, not a grid")
+
+    return np.cumsum(
+        imf_func(N_max, *imf_args, random=random, **imf_kwargs).value_in(
+            u.MSun
+        )
+    )
+
+
+# /def
+
+
 def num_particles_from_mtot_given_mass_func(
     target_mass: u.MSun,
     imf_func: Callable,
@@ -51,13 +254,14 @@ def num_particles_from_mtot_given_mass_func(
     imf_kwargs: dict = {},
     tolerance: float = 0.01,
     random=0,
+    table: Optional[np.ndarray] = None,
 ) -> Tuple[int, Any, Any]:  # TODO correct Any
     """Finds the number of particles in a cluster of mass `target_mass`.
 
     Parameters
     ----------
     target_mass: amuse units.MSun
-        target mass of cluster
+        target mass of cluster, must be positive
     imf_func: function
         the function that generates the IMF
         signature: ``imf_func(number_of_particles, *args, **kwargs)``
@@ -69,9 +273,15 @@ def num_particles_from_mtot_given_mass_func(
         should NOT include `random`
     tolerance: float
         fractional error between `target_mass` and mass(imf(N))
+        not needed, since the closest N in the sample is found,
+        kept for backward compatibility.
     random: number
         the random seed
         for reproducibility
+    table: ndarray, optional
+        a cumulative mass table from `build_imf_mass_table`.
+        if given, `N` is looked up in the table, without drawing from
+        `imf_func`.
 
     Returns
     -------
@@ -82,79 +292,43 @@ def num_particles_from_mtot_given_mass_func(
     err: float
         fractional error between M and `target_mass`
 
+    Notes
+    -----
+    If `random` is truthy, the draws are i.i.d. and the mass of N stars
+    is the mass of the first N stars of one sample. Otherwise each N is
+    drawn separately, since ``imf_func(N)`` need not be the first N
+    masses of a larger draw.
+
     """
-    assert target_mass.value_in(u.MSun) >= 0
+    # work in raw floats [MSun], reattaching units on return
+    target = target_mass.value_in(u.MSun)
+    assert target > 0
+
+    inv_target = 1.0 / target
 
     def _frac_err(M):
-        return np.abs(target_mass - M) / target_mass
-
-    # figuring out good guess
-    # by getting the approximate answer from the total / mean mass
-    mean = imf_func(1000, *imf_args, random=random, **imf_kwargs).mean()
-    N = int(target_mass / mean)
-    M = imf_func(N, *imf_args, **imf_kwargs).sum()
-
-    # lower bound, just N / 2
-    N_low = int(N / 2)
-    M_low = imf_func(N_low, *imf_args, random=random, **imf_kwargs).sum()
-    assert M_low < target_mass
-
-    # upper bound, just 2 N
-    N_up = int(2 * N)
-    M_up = imf_func(N_up, *imf_args, random=random, **imf_kwargs).sum()
-    assert M_up > target_mass
-
-    # iterating to find correct N
-    # stop when reach desired tolerance
-    i: int = 0  # prevent infinite loop
-    while (_frac_err(M) > tolerance) & (i < 50):
-        i += 1
-
-        if M < target_mass:  # set lower bounds = current
-            N_low = N
-            M_low = M
-
-        if M > target_mass:  # set upper bounds = current
-            N_up = N
-            M_up = M
-
-        # set guess
-        N = int((N_low + N_up) / 2)
-        M = imf_func(N, *imf_args, random=random, **imf_kwargs).sum()
-
-        # catching edge cases
-        if N < N_low:
-            N = N_low
-            M = M_low
-            break
-        elif N == N_low:
-            M_Np1 = imf_func(
-                N_low + 1, *imf_args, random=random, **imf_kwargs
-            ).sum()
-            if _frac_err(M_Np1) < _frac_err(M_low):
-                N = N_low + 1
-                M = M_Np1
-            else:
-                N = N_low
-                M = M_low
-            break
-        elif N == N_up:
-            M_Nm1 = imf_func(
-                N_up - 1, *imf_args, random=random, **imf_kwargs
-            ).sum()
-            if _frac_err(M_Nm1) < _frac_err(M_up):
-                N = N_up - 1
-                M = M_Nm1
-            else:
-                N = N_up
-                M = M_up
-            break
-        elif N > N_up:
-            N = N_up
-            M = M_up
-            break
+        return abs(target - M) * inv_target
+
+    if table is not None:  # look up in the table
+        if table[-1] < target:
+            raise ValueError("table does not cover `target_mass`")
+        N = _search_N(table, target)
+        M = table[N - 1]
+        return N, M | u.MSun, _frac_err(M)
+
+    if not random:  # not i.i.d., so draw each N
+        N, M = _search_N_per_draw(
+            target, imf_func, imf_args, imf_kwargs, random
+        )
+        return N, M | u.MSun, _frac_err(M)
 
-    return N, M, _frac_err(M)
+    _, csum = _imf_sample_covering(
+        target, imf_func, imf_args, imf_kwargs, random
+    )
+    N = _search_N(csum, target)
+    M = csum[N - 1]
+
+    return N, M | u.MSun, _frac_err(M)
 
 
 # /def
@@ -211,7 +385,10 @@ def imf_number_of_particles_decorator(
         Notes
         -----
         if number_of_particles has units of mass, treated as Mtot, and will
-        find number_of_particles via Newton-Raphson iteration.
+        find number_of_particles from the cumulative mass of one IMF
+        sample, returning the first number_of_particles masses of that
+        sample. If `random` is falsy, the sample is not i.i.d., so
+        number_of_particles stars are drawn instead.
 
         """
         try:
@@ -223,15 +400,19 @@ def imf_number_of_particles_decorator(
             pass
         else:  # need to figure out number of stars
             random = func_kwargs.pop("random", 0)
-            N, _, _ = num_particles_from_mtot_given_mass_func(
-                number_of_particles,
-                function,
-                tolerance=m_to_n_tol,
-                random=random,
-                imf_kwargs=func_kwargs,
-            )
-            number_of_particles = N
-            # print(number_of_particles)
+            target = number_of_particles.value_in(u.MSun)
+            if not random:  # not i.i.d., so draw N stars
+                number_of_particles, _ = _search_N_per_draw(
+                    target, function, func_args, func_kwargs, random
+                )
+            else:
+                # the masses are the first N of the sample used to find N,
+                # rather than a second draw of N stars
+                masses, csum = _imf_sample_covering(
+                    target, function, func_args, func_kwargs, random
+                )
+                N = _search_N(csum, target)
+                return masses[:N] | u.MSun
 
         return function(
             number_of_particles, *func_args, random=random, **func_kwargs
@@ -37,10 +37,11 @@ __author__ = "Nathaniel Starkman"
 
 # GENERAL
 
-import string
-import numpy as np
 import os
 import os.path
+import string
+
+import numpy as np
 
 # CUSTOM
 
@@ -52,13 +53,22 @@ import os.path
 
 
 def sorted_date_folders(contents):
-    """Return sorted folders that start with a digit."""
-    # sort out files
-    isfile = np.array([os.path.isfile(c) for c in contents])
-    folders = contents[~isfile]
+    """Return sorted folders that start with a digit.
+
+    Parameters
+    ----------
+    contents: array-like of str
+        a directory listing, with paths relative to the working directory
+
+    Returns
+    -------
+    folders: ndarray of str
 
-    # filter to date-start files
-    folders = [f for f in folders if f[0] in string.digits]
+    """
+    # filter to date-start folders, then sort out files
+    folders = [
+        c for c in contents if c[0] in string.digits and not os.path.isfile(c)
+    ]
 
     return np.sort(folders)
 
@@ -66,6 +76,35 @@ def sorted_date_folders(contents):
 # /def
 
 
+def _sorted_date_folders(drct="."):
+    """Return sorted folders in `drct` that start with a digit.
+
+    As `sorted_date_folders`, but lists `drct` itself. scandir entries
+    cache the file type, so there is no stat call per entry.
+
+    Parameters
+    ----------
+    drct: str
+        the directory to search
+
+    Returns
+    -------
+    folders: list of str
+
+    """
+    with os.scandir(drct) as entries:
+        folders = sorted(
+            e.name
+            for e in entries
+            if e.name[0] in string.digits and not e.is_file()
+        )
+
+    return folders
+
+
+# /def
+
+
 # --------------------------------------------------------------------------
 
 
@@ -81,8 +120,7 @@ def make_symlink(drct):
     old_dir = os.getcwd()
     os.chdir(drct)
 
-    contents = np.array(os.listdir("./"))
-    folders = sorted_date_folders(contents)
+    folders = _sorted_date_folders(".")
 
     if len(folders) > 0:  # not empty
         try:
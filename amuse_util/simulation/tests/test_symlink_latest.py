@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for :mod:`~amuse_util.simulation.symlink_latest`."""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+# IMPORTS
+
+# GENERAL
+
+import os
+
+
+# PROJECT-SPECIFIC
+
+from ..symlink_latest import (
+    _sorted_date_folders,
+    make_symlink,
+    sorted_date_folders,
+)
+
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+def make_tree(path):
+    """Date folders, a date-named file, and an undated folder."""
+    for name in ("2020-02-01", "2020-01-01", "notes"):
+        (path / name).mkdir()
+    (path / "2021-01-01.txt").write_text("")
+
+
+# /def
+
+
+def test_sorted_date_folders(tmp_path, monkeypatch):
+    """The public function takes a directory listing."""
+    make_tree(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    folders = sorted_date_folders(os.listdir("."))
+    assert list(folders) == ["2020-01-01", "2020-02-01"]
+    assert _sorted_date_folders(".") == list(folders)
+
+
+# /def
+
+
+def test_make_symlink(tmp_path):
+    """`latest` points to the most recent date folder."""
+    make_tree(tmp_path)
+    make_symlink(str(tmp_path))
+
+    assert os.readlink(tmp_path / "latest") == "./2020-02-01"
+
+
+# /def
+
+
+##############################################################################
+# END
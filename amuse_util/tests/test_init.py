@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the lazy attributes of :mod:`amuse_util`."""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+# IMPORTS
+
+# GENERAL
+
+import pytest
+
+
+# PROJECT-SPECIFIC
+
+import amuse_util
+
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+def test_lazy_attributes():
+    """Lazy attributes are listed, and imported on first access."""
+    assert "ic" in dir(amuse_util)
+    assert "System" in dir(amuse_util)
+
+    from amuse_util.datamodel import System
+
+    assert amuse_util.System is System
+    assert amuse_util.ic.__name__ == "amuse_util.ic"
+
+    with pytest.raises(AttributeError):
+        amuse_util.not_an_attribute
+
+
+# /def
+
+
+##############################################################################
+# END
@@ -18,6 +18,7 @@ __all__ = ["to_astropy", "to_amuse"]
 # GENERAL
 
 import functools
+import weakref
 
 # amuse
 from amuse.units.quantities import Quantity
@@ -29,11 +30,196 @@ from . import astropy_units as apu
 from . import amuse_units as amu
 
 
+###############################################################################
+# PARAMETERS
+
+# frequently converted units, which skip the string round-trip
+_COMMON_UNITS = (  # (amuse, astropy)
+    (amu.kpc, apu.kpc),
+    (amu.parsec, apu.pc),
+    (amu.AU, apu.AU),
+    (amu.km, apu.km),
+    (amu.s, apu.s),
+    (amu.Myr, apu.Myr),
+    (amu.Gyr, apu.Gyr),
+    (amu.MSun, apu.Msun),
+    (amu.kms, apu.km / apu.s),
+)
+
+# id(amuse unit) -> (weakref to the unit, astropy unit)
+# the common units are module-level, so hold them directly
+_ASTROPY_UNITS = {
+    id(amu_unit): ((lambda amu_unit=amu_unit: amu_unit), apy_unit)
+    for amu_unit, apy_unit in _COMMON_UNITS
+}
+
+# astropy unit -> amuse unit
+_AMUSE_UNITS = {apy_unit: amu_unit for amu_unit, apy_unit in _COMMON_UNITS}
+
+
 ###############################################################################
 # CODE
 ###############################################################################
 
 
+@functools.lru_cache(maxsize=256)
+def _astropy_unit_from_str(unit: str):
+    """Astropy unit from its string representation."""
+    return apu.Unit(unit)
+
+
+# /def
+
+
+@functools.lru_cache(maxsize=256)
+def _amuse_unit_from_str(unit: str):
+    """AMUSE unit from its string representation."""
+    return getattr(amu, unit)
+
+
+# /def
+
+
+def _astropy_unit_for(unit):
+    """Astropy unit for an AMUSE unit, cached by identity.
+
+    Skips building the string representation of `unit`.
+    Entries are dropped when `unit` is garbage collected,
+    so a reused ``id`` cannot return a stale unit.
+
+    """
+    key = id(unit)
+    entry = _ASTROPY_UNITS.get(key)
+    if entry is not None and entry[0]() is unit:
+        return entry[1]
+
+    apy_unit = _astropy_unit_from_str(str(unit))
+    try:
+        ref = weakref.ref(unit, lambda _: _ASTROPY_UNITS.pop(key, None))
+    except TypeError:  # not weak-referenceable, don't cache
+        return apy_unit
+    _ASTROPY_UNITS[key] = (ref, apy_unit)
+
+    return apy_unit
+
+
+# /def
+
+
+@functools.lru_cache(maxsize=256)
+def _amuse_unit_for(unit):
+    """AMUSE unit for a (hashable) astropy unit."""
+    try:
+        return _AMUSE_UNITS[unit]
+    except KeyError:
+        return _amuse_unit_from_str(str(unit))
+
+
+# /def
+
+
+def _split_arguments(arguments, name: str = "arguments"):
+    """Split decorator `arguments` into positional indices and kw names.
+
+    Parameters
+    ----------
+    arguments : list
+        integers are indices into `args`
+        strings are names of `kw` arguments
+    name : str
+        name of `arguments`, for the error message
+
+    Returns
+    -------
+    int_idxs : tuple of int
+    str_names : tuple of str
+
+    Raises
+    ------
+    TypeError
+        if an element of `arguments` is not an int or str
+
+    """
+    for itm in arguments:
+        if not isinstance(itm, (int, str)):
+            raise TypeError(f"elements of `{name}` must be int or str")
+
+    int_idxs = tuple(i for i in arguments if isinstance(i, int))
+    str_names = tuple(n for n in arguments if isinstance(n, str))
+
+    return int_idxs, str_names
+
+
+# /def
+
+
+@functools.lru_cache(maxsize=None)
+def _decorator_partial(decorator, **kwargs):
+    """Decorator with its options applied, reused for equal options.
+
+    Parameters
+    ----------
+    decorator : Callable
+    **kwargs
+        the (hashable) options of `decorator`
+
+    Returns
+    -------
+    functools.partial
+
+    """
+    return functools.partial(decorator, **kwargs)
+
+
+# /def
+
+
+# ----------------------------------------------------------------------------
+
+
+def _convert_wrapper(function, arg_plan: dict, kw_plan: dict):
+    """Wrap `function`, converting arguments before the call.
+
+    Parameters
+    ----------
+    function : Callable
+        the wrapped function
+    arg_plan : dict
+        {index: converter} for the positional arguments
+    kw_plan : dict
+        {name: converter} for the keyword arguments
+
+    Returns
+    -------
+    wrapper : types.FunctionType
+
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args, **kw):
+        """Wrapper docstring."""
+        args = list(args)
+        for i, convert in arg_plan.items():
+            if i < len(args):
+                args[i] = convert(args[i])
+        for n, convert in kw_plan.items():
+            if n in kw:
+                kw[n] = convert(kw[n])
+
+        return function(*args, **kw)
+
+    # /def
+
+    return wrapper
+
+
+# /def
+
+
+# ----------------------------------------------------------------------------
+
+
+@functools.singledispatch
 def to_astropy(quantity):
     """Convert AMUSE quantity to astropy quantity.
 
@@ -51,19 +237,22 @@ def to_astropy(quantity):
     Notes
     -----
     requires that amuse units are string represented in astropy
+    dispatches on the type of `quantity`.
 
     """
-    if isinstance(quantity, Quantity):
-        return quantity.value_in(quantity.unit) * apu.Unit(str(quantity.unit))
+    return quantity
+
 
-    else:
-        return quantity
+@to_astropy.register(Quantity)
+def _to_astropy_from_amuse(quantity):
+    """Convert an AMUSE quantity to an astropy quantity."""
+    return quantity.number * _astropy_unit_for(quantity.unit)
 
 
 # /def
 
 
-def to_astropy_decorator(function=None, *, arguments=[]):
+def to_astropy_decorator(function=None, *, arguments=()):
     """Function decorator to convert inputs to Astropy quantities.
 
     Parameters
@@ -71,7 +260,7 @@ def to_astropy_decorator(function=None, *, arguments=[]):
     function : types.FunctionType or None, optional
         the function to be decoratored
         if None, then returns decorator to apply.
-    arguments : list, optional
+    arguments : list or tuple, optional
         arguments to convert
         integers are indices into `arguments`
         strings are names of `kw` arguments
@@ -85,24 +274,17 @@ def to_astropy_decorator(function=None, *, arguments=[]):
 
     """
     if function is None:  # allowing for optional arguments
-        return functools.partial(to_astropy_decorator, arguments=arguments)
-
-    @functools.wraps(function)
-    def wrapper(*args, **kw):
-        """Wrapper docstring."""
-        for itm in arguments:
-            if isinstance(itm, int):
-                args[itm] = to_astropy(args[itm])
-            elif isinstance(itm, str):
-                kw[itm] = to_astropy(kw[itm])
-            else:
-                raise TypeError("elements of `args` must be int or str")
+        return _decorator_partial(
+            to_astropy_decorator, arguments=tuple(arguments)
+        )
 
-        return function(*args, **kw)
+    int_idxs, str_names = _split_arguments(arguments)
 
-    # /def
-
-    return wrapper
+    return _convert_wrapper(
+        function,
+        {i: to_astropy for i in int_idxs},
+        {n: to_astropy for n in str_names},
+    )
 
 
 # /def
@@ -111,26 +293,28 @@ def to_astropy_decorator(function=None, *, arguments=[]):
 # ----------------------------------------------------------------------------
 
 
+@functools.singledispatch
 def to_amuse(quantity):
-    """Convert AMUSE quantity to astropy quantity.
+    """Convert astropy quantity to AMUSE quantity.
 
-    only amuse quantities need to be converted.
-    floats and astropy quantities are left as is.
+    only astropy quantities need to be converted.
+    floats and amuse quantities are left as is.
+    dispatches on the type of `quantity`.
 
     """
-    if isinstance(quantity, apu.Quantity):
-        return quantity.to_value(quantity.unit) | getattr(
-            amu, (str(quantity.unit))
-        )
+    return quantity
+
 
-    else:
-        return quantity
+@to_amuse.register(apu.Quantity)
+def _to_amuse_from_astropy(quantity):
+    """Convert an astropy quantity to an AMUSE quantity."""
+    return quantity.value | _amuse_unit_for(quantity.unit)
 
 
 # /def
 
 
-def to_amuse_decorator(function=None, *, arguments=[]):
+def to_amuse_decorator(function=None, *, arguments=()):
     """Function decorator to convert inputs to AMUSE quantities.
 
     Parameters
@@ -138,7 +322,7 @@ def to_amuse_decorator(function=None, *, arguments=[]):
     function : types.FunctionType or None, optional
         the function to be decoratored
         if None, then returns decorator to apply.
-    arguments : list, optional
+    arguments : list or tuple, optional
         arguments to convert
         integers are indices into `arguments`
         strings are names of `kw` arguments
@@ -152,24 +336,17 @@ def to_amuse_decorator(function=None, *, arguments=[]):
 
     """
     if function is None:  # allowing for optional arguments
-        return functools.partial(to_amuse_decorator, arguments=arguments)
-
-    @functools.wraps(function)
-    def wrapper(*args, **kw):
-        """Wrapper docstring."""
-        for itm in arguments:
-            if isinstance(itm, int):
-                args[itm] = to_amuse(args[itm])
-            elif isinstance(itm, str):
-                kw[itm] = to_amuse(kw[itm])
-            else:
-                raise TypeError("elements of `args` must be int or str")
-
-        return function(*args, **kw)
+        return _decorator_partial(
+            to_amuse_decorator, arguments=tuple(arguments)
+        )
 
-    # /def
+    int_idxs, str_names = _split_arguments(arguments)
 
-    return wrapper
+    return _convert_wrapper(
+        function,
+        {i: to_amuse for i in int_idxs},
+        {n: to_amuse for n in str_names},
+    )
 
 
 # /def
@@ -179,7 +356,7 @@ def to_amuse_decorator(function=None, *, arguments=[]):
 
 
 def convert_units_decorator(
-    function=None, *, to_astropy_args=[], to_amuse_args=[]
+    function=None, *, to_astropy_args=(), to_amuse_args=()
 ):
     """Function decorator to convert inputs to AMUSE quantities.
 
@@ -188,11 +365,11 @@ def convert_units_decorator(
     function : types.FunctionType or None, optional
         the function to be decoratored
         if None, then returns decorator to apply.
-    to_astropy_args : list, optional
+    to_astropy_args : list or tuple, optional
         arguments to convert to astropy units
         integers are indices into `args`
         strings are names of `kw` arguments
-    to_amuse_args : list, optional
+    to_amuse_args : list or tuple, optional
         arguments to convert to amuse units
         integers are indices into `args`
         strings are names of `kw` arguments
@@ -206,39 +383,22 @@ def convert_units_decorator(
 
     """
     if function is None:  # allowing for optional arguments
-        return functools.partial(
+        return _decorator_partial(
             convert_units_decorator,
-            to_astropy_args=to_astropy_args,
-            to_amuse_args=to_amuse_args,
+            to_astropy_args=tuple(to_astropy_args),
+            to_amuse_args=tuple(to_amuse_args),
         )
 
-    @functools.wraps(function)
-    def wrapper(*args, **kw):
-        """Wrapper docstring."""
-        for itm in to_astropy_args:
-            if isinstance(itm, int):
-                args[itm] = to_astropy(args[itm])
-            elif isinstance(itm, str):
-                kw[itm] = to_astropy(kw[itm])
-            else:
-                raise TypeError(
-                    "elements of `to_astropy_args` must be int or str"
-                )
-        for itm in to_amuse_args:
-            if isinstance(itm, int):
-                args[itm] = to_amuse(args[itm])
-            elif isinstance(itm, str):
-                kw[itm] = to_amuse(kw[itm])
-            else:
-                raise TypeError(
-                    "elements of `to_amuse_args` must be int or str"
-                )
+    apy_idxs, apy_names = _split_arguments(to_astropy_args, "to_astropy_args")
+    amu_idxs, amu_names = _split_arguments(to_amuse_args, "to_amuse_args")
 
-        return function(*args, **kw)
+    # one converter per argument, so each is visited once per call
+    arg_plan = {i: to_astropy for i in apy_idxs}
+    arg_plan.update((i, to_amuse) for i in amu_idxs)
+    kw_plan = {n: to_astropy for n in apy_names}
+    kw_plan.update((n, to_amuse) for n in amu_names)
 
-    # /def
-
-    return wrapper
+    return _convert_wrapper(function, arg_plan, kw_plan)
 
 
 # /def
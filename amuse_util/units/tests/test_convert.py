@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for :mod:`~amuse_util.units.convert`."""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+# IMPORTS
+
+# GENERAL
+
+import inspect
+import pickle
+
+import astropy.units as u
+from amuse.units import units as amu
+
+
+# PROJECT-SPECIFIC
+
+from ..convert import (
+    convert_units_decorator,
+    to_amuse_decorator,
+    to_astropy_decorator,
+)
+
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+@to_amuse_decorator(arguments=[0, "y"])
+def amuse_sum(x, y=0 | amu.kpc):
+    """Sum in AMUSE quantities."""
+    return x + y
+
+
+# /def
+
+
+@to_astropy_decorator(arguments=[0])
+def astropy_value(x):
+    """Value in kpc of an astropy quantity."""
+    return x.to_value(u.kpc)
+
+
+# /def
+
+
+@convert_units_decorator(to_astropy_args=[0], to_amuse_args=["y"])
+def mixed(x, *, y):
+    """Value in kpc of an astropy and an AMUSE quantity."""
+    return x.to_value(u.kpc), y.value_in(amu.kpc)
+
+
+# /def
+
+
+# --------------------------------------------------------------------------
+
+
+def test_decorators_convert():
+    """Marked arguments are converted, by position and by name."""
+    assert amuse_sum(1 * u.kpc, y=2 * u.kpc).value_in(amu.kpc) == 3.0
+    assert astropy_value(1 | amu.kpc) == 1.0
+    assert mixed(1 | amu.kpc, y=2 * u.kpc) == (1.0, 2.0)
+
+
+# /def
+
+
+def test_decorated_functions_pickle():
+    """Decorated functions stay functions, and pickle by name."""
+    for func in (amuse_sum, astropy_value, mixed):
+        assert inspect.isfunction(func)
+        assert pickle.loads(pickle.dumps(func)) is func
+
+    assert amuse_sum.__wrapped__.__name__ == "amuse_sum"
+
+
+# /def
+
+
+##############################################################################
+# END
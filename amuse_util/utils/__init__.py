@@ -11,6 +11,8 @@ __author__ = "Nathaniel Starkman"
 
 __all__ = [
     "amuseify_array",
+    "strip_units",
+    "attach_units",
     "draw_unit_normal",
     # "store_function_input",
 ]
@@ -21,10 +23,15 @@ __all__ = [
 
 # GENERAL
 
+import functools
+import inspect
+import threading
+
 import numpy as np
 
 # amuse
 from amuse.units.core import unit as Unit
+from amuse.units.quantities import VectorQuantity
 
 # typing
 from typing import Optional, Sequence
@@ -41,11 +48,45 @@ from utilipy.decorators import store_function_input
 _GOOD_DECORATORS: bool
 
 
+##############################################################################
+# PARAMETERS
+
+_LOCAL = threading.local()  # per-thread scratch generator, see `_rng_for`
+
+
 ##############################################################################
 # CODE
 ##############################################################################
 
 
+@functools.lru_cache(maxsize=1024)
+def _seed_state(seed: int) -> dict:
+    """Initial PCG64 state for an integer seed."""
+    return np.random.PCG64(seed).state
+
+
+# /def
+
+
+def _rng_for(seed: int) -> np.random.Generator:
+    """Generator at the initial state for `seed`.
+
+    Same stream as ``np.random.default_rng(seed)``, but resets one
+    generator per thread to a cached state, rather than seeding anew.
+    Valid until the next call in the same thread.
+
+    """
+    try:
+        rng = _LOCAL.rng
+    except AttributeError:
+        rng = _LOCAL.rng = np.random.Generator(np.random.PCG64())
+    rng.bit_generator.state = _seed_state(seed)
+    return rng
+
+
+# /def
+
+
 def amuseify_array(
     arr: np.ndarray, to_unit: Optional[Unit] = None
 ) -> Sequence:
@@ -68,11 +109,152 @@ def amuseify_array(
     quantity<[1.0, 2.0] Myr>
 
     """
+    if isinstance(arr, VectorQuantity):  # already an amuse array, so copy
+        return arr.copy() if to_unit is None else arr.as_quantity_in(to_unit)
+
+    units = [x.unit for x in arr]
     if to_unit is None:
-        to_unit = arr[0].unit
-    amuse_arr = np.array([x.value_in(to_unit) for x in arr]) | to_unit
+        to_unit = units[0]
+
+    values = np.fromiter(
+        (x.number for x in arr), dtype=np.float64, count=len(arr)
+    )
+
+    first = units[0] if units else to_unit
+    if all(unit is first for unit in units):  # one unit: scalar multiply
+        factor = first.value_in(to_unit)
+        if factor != 1.0:
+            values *= factor
+
+    else:  # one conversion factor per distinct unit
+        factors = {}
+        for unit in units:
+            if id(unit) not in factors:
+                factors[id(unit)] = unit.value_in(to_unit)
+        values *= np.fromiter(
+            (factors[id(unit)] for unit in units),
+            dtype=np.float64,
+            count=len(units),
+        )
+
+    return values | to_unit
+
+
+# /def
+
+
+def strip_units(arr: Sequence, to_unit: Optional[Unit] = None):
+    """Unitless values of amuse quantities, and their unit.
+
+    For passing quantities to numerical code that cannot handle units,
+    like numba or scipy. Restore the units with `attach_units`.
+
+    Parameters
+    ----------
+    arr: amuse quantity array or sequence of amuse quantities
+    to_unit: amuse unit, optional
+        the unit of the values. defaults to the unit of `arr`
+
+    Returns
+    -------
+    values: ndarray
+        a copy, does not share memory with `arr`
+    unit: amuse unit
+
+    Examples
+    --------
+    >>> values, unit = strip_units([1 | amu.Myr, 0.002 | amu.Gyr])
+    >>> list(values), str(unit)
+    ([1.0, 2.0], 'Myr')
+    >>> attach_units(2 * values, unit)  # e.g. after a numerical kernel
+    quantity<[2.0, 4.0] Myr>
+
+    """
+    quantity = amuseify_array(arr, to_unit=to_unit)
+    return quantity.number, quantity.unit
+
+
+# /def
+
 
-    return amuse_arr
+def attach_units(values: np.ndarray, unit: Unit) -> Sequence:
+    """Attach an amuse unit to unitless values.
+
+    Parameters
+    ----------
+    values: ndarray
+    unit: amuse unit
+
+    Returns
+    -------
+    amuse quantity array
+
+    """
+    return values | unit
+
+
+# /def
+
+
+# ------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=None)
+def _store_kwargs(cls: type) -> dict:
+    """Keyword arguments to index the particle store of `cls` by index.
+
+    Older AMUSE store methods take particle keys unless ``by_key=False``,
+    newer ones only take store indices.
+
+    """
+    parameters = inspect.signature(cls.get_values_in_store).parameters
+    return {"by_key": False} if "by_key" in parameters else {}
+
+
+# /def
+
+
+def _get_store_values(particles, attributes: Sequence) -> list:
+    """Values of `attributes` of all `particles`, in one store access.
+
+    Parameters
+    ----------
+    particles: Particles
+    attributes: list of str
+
+    Returns
+    -------
+    values: list
+        one quantity array per attribute
+
+    """
+    return particles.get_values_in_store(
+        particles.get_all_indices_in_store(),
+        attributes,
+        **_store_kwargs(particles.__class__),  # also through proxies
+    )
+
+
+# /def
+
+
+def _set_store_values(particles, attributes: Sequence, values: Sequence):
+    """Set `attributes` of all `particles`, in one store access.
+
+    Parameters
+    ----------
+    particles: Particles
+    attributes: list of str
+    values: list
+        one quantity array per attribute
+
+    """
+    particles.set_values_in_store(
+        particles.get_all_indices_in_store(),
+        attributes,
+        values,
+        **_store_kwargs(particles.__class__),  # also through proxies
+    )
 
 
 # /def
@@ -96,40 +278,51 @@ def draw_unit_normal(
     loc: float
     scale: float
     size: int
-    random: Seed
+    random: Seed or Generator or RandomState
+        a seed is passed to ``np.random.default_rng``
 
     Returns
     -------
-    draws: (ndim, size) array
-        multivariate normal
+    draws: (size, ndim) array
+        multivariate normal, normalized to unit length.
+        C-contiguous.
 
     """
-    # if not isinstance(random, Generator):
-    #     random = np.random.default_rng(random)
-    if isinstance(random, int):
-        random = np.random.RandomState(random)
-
-    # draw random
-    draws = np.array(
-        [random.normal(loc=loc, scale=scale, size=size) for _ in range(ndim)]
-    )
-    draws /= np.linalg.norm(draws, axis=0)  # normalizing
-
-    # handle when x=y=z=0
-    while (draws == 0).sum() > 0:
-        where_0 = draws == 0
-        num_where_0 = where_0.sum()
-
-        if num_where_0 > 0:
-            draws[where_0] = np.array(
-                [
-                    random.normal(loc=loc, scale=scale, size=num_where_0)
-                    for _ in range(ndim)
-                ]
-            )
-            draws[where_0] /= np.linalg.norm(draws[where_0], axis=0)
-
-    return draws.T
+    if isinstance(random, (int, np.integer)):
+        random = _rng_for(int(random))
+    elif not isinstance(random, (np.random.Generator, np.random.RandomState)):
+        random = np.random.default_rng(random)
+
+    def _draw(out):
+        """Normal draws into `out`, scaled and shifted in-place."""
+        if isinstance(random, np.random.Generator):
+            random.standard_normal(out=out)
+        else:  # RandomState has no `out`
+            out[...] = random.standard_normal(out.shape)
+        if scale != 1.0:
+            out *= scale
+        if loc != 0.0:
+            out += loc
+        return out
+
+    # draw random, all dimensions at once, in the output layout
+    draws = _draw(np.empty((size, ndim)))
+    norms = np.sqrt(np.einsum("ij,ij->i", draws, draws))
+
+    # handle when x=y=z=0, redrawing only those rows
+    # into a reused buffer
+    bad = norms == 0
+    buffer = np.empty(ndim * bad.sum())  # flat, so slices are contiguous
+    while bad.any():
+        redraws = _draw(buffer[: ndim * bad.sum()].reshape(-1, ndim))
+        draws[bad] = redraws
+        norms[bad] = np.sqrt(np.einsum("ij,ij->i", redraws, redraws))
+        bad = norms == 0
+
+    # normalizing
+    draws *= np.reciprocal(norms, out=norms)[:, None]
+
+    return draws
 
 
 # /def
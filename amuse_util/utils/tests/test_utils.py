@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for :mod:`~amuse_util.utils`."""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+# IMPORTS
+
+# GENERAL
+
+import numpy as np
+
+from amuse.datamodel import Particles
+from amuse.units import units as amu
+
+
+# PROJECT-SPECIFIC
+
+from .. import (
+    _get_store_values,
+    _set_store_values,
+    _store_kwargs,
+    amuseify_array,
+    draw_unit_normal,
+)
+
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+def test_store_kwargs():
+    """Only store methods that default to keys get ``by_key=False``."""
+
+    class KeyStore:
+        def get_values_in_store(self, indices, attributes, by_key=True):
+            pass
+
+    class IndexStore:
+        def get_values_in_store(self, indices, attributes):
+            pass
+
+    assert _store_kwargs(KeyStore) == {"by_key": False}
+    assert _store_kwargs(IndexStore) == {}
+
+
+# /def
+
+
+def test_store_values_roundtrip():
+    """Store values are read and written in particle order."""
+    particles = Particles(3)
+    particles.x = [1.0, 2.0, 3.0] | amu.pc
+    particles.mass = [4.0, 5.0, 6.0] | amu.MSun
+
+    x, mass = _get_store_values(particles, ["x", "mass"])
+    assert np.array_equal(x.value_in(amu.pc), [1.0, 2.0, 3.0])
+    assert np.array_equal(mass.value_in(amu.MSun), [4.0, 5.0, 6.0])
+
+    _set_store_values(particles, ["x"], [x * 2])
+    assert np.array_equal(particles.x.value_in(amu.pc), [2.0, 4.0, 6.0])
+    assert np.array_equal(particles[1].x.value_in(amu.pc), 4.0)
+
+
+# /def
+
+
+def test_amuseify_array_copies():
+    """An amuse array input is copied, not returned."""
+    arr = [1.0, 2.0] | amu.Myr
+    for out in (amuseify_array(arr), amuseify_array(arr, to_unit=amu.Myr)):
+        out[0] = 5.0 | amu.Myr
+        assert arr[0] == 1.0 | amu.Myr
+
+
+# /def
+
+
+def test_amuseify_array_mixed_units():
+    """Mixed compatible units are converted to one unit."""
+    out = amuseify_array([1 | amu.Myr, 0.002 | amu.Gyr], to_unit=amu.Myr)
+    assert np.allclose(out.value_in(amu.Myr), [1.0, 2.0])
+
+
+# /def
+
+
+def test_draw_unit_normal_seeded():
+    """An integer seed gives the ``default_rng`` (PCG64) stream, each call."""
+    draws = draw_unit_normal(3, size=5, random=42)
+
+    want = np.random.default_rng(42).standard_normal((5, 3))
+    want /= np.linalg.norm(want, axis=1)[:, None]
+    assert np.allclose(draws, want)
+
+    draw_unit_normal(3, size=5, random=7)  # no state leaks between seeds
+    assert np.array_equal(draw_unit_normal(3, size=5, random=42), draws)
+
+
+# /def
+
+
+def test_draw_unit_normal_output():
+    """Draws are C-contiguous (size, ndim) unit vectors, from any RNG."""
+    for random in (
+        0,
+        np.random.default_rng(0),
+        np.random.RandomState(0),
+        None,
+    ):
+        draws = draw_unit_normal(
+            2, loc=1.0, scale=2.0, size=100, random=random
+        )
+        assert draws.shape == (100, 2)
+        assert draws.flags["C_CONTIGUOUS"]
+        assert np.allclose(np.linalg.norm(draws, axis=1), 1.0)
+
+    rng = np.random.default_rng(0)  # a Generator is advanced, not reset
+    assert not np.array_equal(
+        draw_unit_normal(3, random=rng), draw_unit_normal(3, random=rng)
+    )
+
+
+# /def
+
+
+##############################################################################
+# END